@@ -0,0 +1,460 @@
+"""
+Numba Kernels
+
+JIT-compiled numeric loops used by the analysis modules.
+
+Numba is an optional dependency. When it is not installed, `njit` is a
+no-op decorator and NUMBA_AVAILABLE is False, so callers can fall back
+to their NumPy implementations.
+
+Kernels that sit on the live tick path are declared with explicit
+signatures. Numba then compiles them eagerly at import time, or loads
+them from the on-disk cache, instead of on the first call. The first
+signal of a session therefore pays no JIT warmup.
+"""
+
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+if NUMBA_AVAILABLE:
+    # Read-only arrays also accept writable ones; pandas hands out
+    # read-only views under copy-on-write
+    _F64_ARRAY = types.Array(types.float64, 1, 'A', readonly=True)
+    _STOP_HUNT_RESULT = types.Tuple((types.int64[:], types.int8[:]))
+    _STOP_HUNT_SIGNATURE = _STOP_HUNT_RESULT(_F64_ARRAY, _F64_ARRAY, _F64_ARRAY, _F64_ARRAY)
+    _ZONE_SCAN_RESULT = types.Tuple((
+        types.int64[:], types.int64[:],
+        types.int64[:], types.int8[:],
+        types.int64[:], types.int8[:],
+    ))
+    _ZONE_SCAN_SIGNATURE = _ZONE_SCAN_RESULT(_F64_ARRAY, _F64_ARRAY, _F64_ARRAY, _F64_ARRAY, types.float64)
+    _ROLLING_SIGNATURE = types.float64[:](_F64_ARRAY, types.int64, types.boolean)
+    _GROUP_SIGNATURE = types.Tuple((types.int64[:], types.int64[:], types.int64[:]))(
+        _F64_ARRAY, types.float64, types.int64
+    )
+    _DUAL_EMA_SIGNATURE = types.Tuple((types.float64[:], types.float64[:]))(
+        _F64_ARRAY, types.float64, types.float64
+    )
+else:
+    _STOP_HUNT_SIGNATURE = _ZONE_SCAN_SIGNATURE = None
+    _ROLLING_SIGNATURE = _GROUP_SIGNATURE = _DUAL_EMA_SIGNATURE = None
+
+
+@njit(_ROLLING_SIGNATURE, cache=True, nogil=True)
+def rolling_extremes(values: np.ndarray, window: int, find_highs: bool) -> np.ndarray:
+    """
+    Max (or min) of every full window with a monotonic deque
+
+    The deque holds indices whose values are decreasing (increasing for
+    minima), so its head is always the current window's extreme. Each
+    index is pushed and popped at most once, making the pass O(N)
+    regardless of the window size.
+
+    Args:
+        values: float64 prices, at least `window` long
+        window: Window size
+        find_highs: True for rolling max, False for rolling min
+
+    Returns:
+        Array of len(values) - window + 1 extremes; element k covers
+        values[k:k + window]
+    """
+    n = values.shape[0]
+    out = np.empty(n - window + 1, dtype=values.dtype)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+
+    for i in range(n):
+        if find_highs:
+            while tail > head and values[deque[tail - 1]] <= values[i]:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= values[i]:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+
+        if deque[head] <= i - window:
+            head += 1
+
+        if i >= window - 1:
+            out[i - window + 1] = values[deque[head]]
+
+    return out
+
+
+@njit(_DUAL_EMA_SIGNATURE, cache=True, nogil=True)
+def dual_ema(values: np.ndarray, fast_alpha: float, slow_alpha: float):
+    """
+    Two exponential moving averages in one pass
+
+    Same recurrence as pandas `ewm(alpha=..., adjust=False).mean()`,
+    including its normalisation by the weight sum, so the results match
+    pandas bit for bit on NaN-free input.
+
+    Args:
+        values: float64 prices without NaNs, at least one long
+        fast_alpha: Smoothing factor of the fast EMA
+        slow_alpha: Smoothing factor of the slow EMA
+
+    Returns:
+        Tuple of (fast EMA, slow EMA) arrays, each len(values) long
+    """
+    n = values.shape[0]
+    fast = np.empty(n, dtype=np.float64)
+    slow = np.empty(n, dtype=np.float64)
+    fast_decay = 1.0 - fast_alpha
+    slow_decay = 1.0 - slow_alpha
+
+    fast_ema = values[0]
+    slow_ema = values[0]
+    fast[0] = fast_ema
+    slow[0] = slow_ema
+
+    for i in range(1, n):
+        value = values[i]
+        if fast_ema != value:
+            fast_ema = (fast_decay * fast_ema + fast_alpha * value) / (fast_decay + fast_alpha)
+        if slow_ema != value:
+            slow_ema = (slow_decay * slow_ema + slow_alpha * value) / (slow_decay + slow_alpha)
+        fast[i] = fast_ema
+        slow[i] = slow_ema
+
+    return fast, slow
+
+
+@njit(inline='always')
+def _find_free(next_free: np.ndarray, k: int) -> int:
+    """First ungrouped sorted slot at or after k, with path compression"""
+    root = k
+    while next_free[root] != root:
+        root = next_free[root]
+    while next_free[k] != root:
+        following = next_free[k]
+        next_free[k] = root
+        k = following
+    return root
+
+
+@njit(_GROUP_SIGNATURE, cache=True, nogil=True)
+def group_equal_levels(levels: np.ndarray, tolerance: float, min_touches: int):
+    """
+    Compiled equal-level grouping
+
+    Same rule and output layout as liquidity_zones._group_equal_levels:
+    chronological anchors collect every ungrouped level within
+    `tolerance`, located through sorted searchsorted windows and a
+    next-free pointer table.
+
+    Args:
+        levels: Swing prices in chronological order
+        tolerance: Maximum relative distance from the anchor
+        min_touches: Minimum group size to report
+
+    Returns:
+        Tuple of (anchors, members, starts) in reduceat segment layout
+    """
+    count = levels.shape[0]
+    order = np.argsort(levels, kind='mergesort')
+    sorted_levels = levels[order]
+
+    # Slightly widened windows; the exact relative test below decides membership
+    window_start = np.searchsorted(sorted_levels, levels * (1 - tolerance) * (1 - 1e-9), side='left')
+    window_end = np.searchsorted(sorted_levels, levels * (1 + tolerance) * (1 + 1e-9), side='right')
+
+    next_free = np.arange(count + 1)
+    grouped = np.zeros(count, dtype=np.bool_)
+    anchors = np.empty(count, dtype=np.int64)
+    members = np.empty(count, dtype=np.int64)
+    starts = np.empty(count, dtype=np.int64)
+    group_count = 0
+    member_count = 0
+
+    for anchor in range(count):
+        if grouped[anchor]:
+            continue
+
+        anchor_level = levels[anchor]
+        first = member_count
+        end = window_end[anchor]
+        k = _find_free(next_free, window_start[anchor])
+
+        while k < end:
+            j = order[k]
+            if abs(levels[j] - anchor_level) / anchor_level <= tolerance:
+                members[member_count] = j
+                member_count += 1
+                grouped[j] = True
+                next_free[k] = k + 1
+            k = _find_free(next_free, k + 1)
+
+        if member_count - first >= min_touches:
+            members[first:member_count] = np.sort(members[first:member_count])
+            anchors[group_count] = anchor
+            starts[group_count] = first
+            group_count += 1
+        else:
+            # Too few touches: the levels stay claimed but are not reported
+            member_count = first
+
+    return anchors[:group_count], members[:member_count], starts[:group_count]
+
+
+@njit(inline='always')
+def _scan_stop_hunts(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    lookback: int
+):
+    """
+    Find stop-hunt candles in one pass over OHLC arrays
+
+    A buy-side stop hunt takes out the lowest low of the previous
+    `lookback` bars, closes bullish and is followed by a higher close;
+    a sell-side hunt is the mirror image. The lookback max/min are
+    carried forward and only rescanned when the bar leaving the window
+    was the extreme.
+
+    Args:
+        open_, high, low, close: float64 price arrays of equal length
+        lookback: Number of prior bars defining the recent range
+
+    Returns:
+        Tuple of (positions, kinds) - candle positions and +1 for a
+        buy-side hunt, -1 for a sell-side hunt
+    """
+    n = high.shape[0]
+    size = n - lookback - 1
+    if size < 0:
+        size = 0
+
+    positions = np.empty(size, dtype=np.int64)
+    kinds = np.empty(size, dtype=np.int8)
+    count = 0
+
+    if size == 0:
+        return positions, kinds
+
+    recent_high = high[0]
+    recent_low = low[0]
+    for j in range(1, lookback):
+        if high[j] > recent_high:
+            recent_high = high[j]
+        if low[j] < recent_low:
+            recent_low = low[j]
+
+    for i in range(lookback, n - 1):
+        if i > lookback:
+            # Window slides from [i-1-lookback, i-1) to [i-lookback, i)
+            entering = i - 1
+            leaving = i - 1 - lookback
+
+            if high[entering] >= recent_high:
+                recent_high = high[entering]
+            elif high[leaving] == recent_high:
+                recent_high = high[i - lookback:i].max()
+
+            if low[entering] <= recent_low:
+                recent_low = low[entering]
+            elif low[leaving] == recent_low:
+                recent_low = low[i - lookback:i].min()
+
+        if low[i] < recent_low and close[i] > open_[i] and close[i + 1] > close[i]:
+            positions[count] = i
+            kinds[count] = 1
+            count += 1
+        elif high[i] > recent_high and close[i] < open_[i] and close[i + 1] < close[i]:
+            positions[count] = i
+            kinds[count] = -1
+            count += 1
+
+    return positions[:count], kinds[:count]
+
+
+@functools.lru_cache(maxsize=None)
+def make_stop_hunt_scanner(lookback: int):
+    """
+    Build a stop-hunt scanner specialized for a fixed lookback
+
+    The lookback is frozen into the closure, and _scan_stop_hunts is
+    inlined into it. Numba therefore compiles it as a constant, so the
+    window rescans have a known trip count LLVM can unroll. Scanners are
+    memoized per lookback and cached on disk.
+
+    Args:
+        lookback: Number of prior bars defining the recent range
+
+    Returns:
+        Function (open_, high, low, close) -> (positions, kinds), see
+        _scan_stop_hunts
+    """
+    @njit(_STOP_HUNT_SIGNATURE, cache=True, nogil=True)
+    def scan_stop_hunts(open_, high, low, close):
+        return _scan_stop_hunts(open_, high, low, close, lookback)
+
+    return scan_stop_hunts
+
+
+@njit(inline='always')
+def _scan_zones(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    min_gap: float,
+    lookback: int,
+    window: int
+):
+    """
+    Find swing points, stop hunts and fair value gaps in one pass
+
+    Each bar i is read once and feeds three stencils:
+
+    - the swing window ending at i, whose center bar is a swing high (low)
+      when it equals the window max (min)
+    - the FVG stencil over bars i-2..i
+    - the stop-hunt test at i, against the carried range of the previous
+      `lookback` bars (see _scan_stop_hunts)
+
+    Args:
+        open_, high, low, close: float64 price arrays of equal length
+        min_gap: Minimum FVG size relative to price, in the array dtype
+        lookback: Number of prior bars defining the stop-hunt range
+        window: Swing detection window
+
+    Returns:
+        Tuple of (swing_highs, swing_lows, hunt_positions, hunt_kinds,
+        gap_positions, gap_kinds); kinds are +1 for buy-side hunts and
+        bullish gaps, -1 for sell-side hunts and bearish gaps
+    """
+    n = high.shape[0]
+    center = (window - 1) // 2
+
+    swing_highs = np.empty(n, dtype=np.int64)
+    swing_lows = np.empty(n, dtype=np.int64)
+    hunt_positions = np.empty(n, dtype=np.int64)
+    hunt_kinds = np.empty(n, dtype=np.int8)
+    gap_positions = np.empty(n, dtype=np.int64)
+    gap_kinds = np.empty(n, dtype=np.int8)
+    swing_high_count = 0
+    swing_low_count = 0
+    hunt_count = 0
+    gap_count = 0
+
+    recent_high = high[0] if n > 0 else 0.0
+    recent_low = low[0] if n > 0 else 0.0
+
+    for i in range(n):
+        # Swing window covering bars i-window+1..i, labelled at its center
+        if i >= window - 1:
+            first = i - window + 1
+            window_high = high[first]
+            window_low = low[first]
+            for j in range(first + 1, i + 1):
+                if high[j] > window_high:
+                    window_high = high[j]
+                if low[j] < window_low:
+                    window_low = low[j]
+
+            c = first + center
+            if high[c] == window_high:
+                swing_highs[swing_high_count] = c
+                swing_high_count += 1
+            if low[c] == window_low:
+                swing_lows[swing_low_count] = c
+                swing_low_count += 1
+
+        # Fair value gap: candle 1 = bar i-2, candle 3 = bar i
+        if i >= 2:
+            high1 = high[i - 2]
+            low1 = low[i - 2]
+            if high1 < low[i] and (low[i] - high1) / high1 >= min_gap:
+                gap_positions[gap_count] = i
+                gap_kinds[gap_count] = 1
+                gap_count += 1
+            elif low1 > high[i] and (low1 - high[i]) / high[i] >= min_gap:
+                gap_positions[gap_count] = i
+                gap_kinds[gap_count] = -1
+                gap_count += 1
+
+        # Stop hunt at bar i against bars i-lookback..i-1
+        if i >= lookback and i < n - 1:
+            if i == lookback:
+                recent_high = high[0]
+                recent_low = low[0]
+                for j in range(1, lookback):
+                    if high[j] > recent_high:
+                        recent_high = high[j]
+                    if low[j] < recent_low:
+                        recent_low = low[j]
+            else:
+                entering = i - 1
+                leaving = i - 1 - lookback
+
+                if high[entering] >= recent_high:
+                    recent_high = high[entering]
+                elif high[leaving] == recent_high:
+                    recent_high = high[i - lookback:i].max()
+
+                if low[entering] <= recent_low:
+                    recent_low = low[entering]
+                elif low[leaving] == recent_low:
+                    recent_low = low[i - lookback:i].min()
+
+            if low[i] < recent_low and close[i] > open_[i] and close[i + 1] > close[i]:
+                hunt_positions[hunt_count] = i
+                hunt_kinds[hunt_count] = 1
+                hunt_count += 1
+            elif high[i] > recent_high and close[i] < open_[i] and close[i + 1] < close[i]:
+                hunt_positions[hunt_count] = i
+                hunt_kinds[hunt_count] = -1
+                hunt_count += 1
+
+    return (
+        swing_highs[:swing_high_count], swing_lows[:swing_low_count],
+        hunt_positions[:hunt_count], hunt_kinds[:hunt_count],
+        gap_positions[:gap_count], gap_kinds[:gap_count],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def make_zone_scanner(lookback: int, window: int):
+    """
+    Build a fused zone scanner specialized for a fixed lookback and window
+
+    Like make_stop_hunt_scanner, both sizes are compile-time constants
+    of the returned kernel.
+
+    Args:
+        lookback: Number of prior bars defining the stop-hunt range
+        window: Swing detection window
+
+    Returns:
+        Function (open_, high, low, close, min_gap) -> see _scan_zones
+    """
+    @njit(_ZONE_SCAN_SIGNATURE, cache=True, nogil=True)
+    def scan_zones(open_, high, low, close, min_gap):
+        return _scan_zones(open_, high, low, close, min_gap, lookback, window)
+
+    return scan_zones
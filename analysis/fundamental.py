@@ -5,14 +5,22 @@ Analyzes economic calendar events to determine market direction.
 Filters high-impact news and determines USD strength/weakness.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta, date
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import asyncio
+import bisect
+import functools
 import logging
+import re
+import time
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root, for running this module as a script; added only once
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core.enums import (
     CurrencyPair,
@@ -28,6 +36,32 @@ from data import ForexFactoryAPI, EconomicEvent
 logger = logging.getLogger(__name__)
 
 
+# Characters stripped from calendar values before parsing
+_STRIP_CHARS = str.maketrans('', '', '%,')
+
+# Magnitude suffixes used by the economic calendar
+_SUFFIX_MULTIPLIERS = {'K': 1e3, 'M': 1e6, 'B': 1e9}
+_SUFFIXES = tuple(_SUFFIX_MULTIPLIERS)
+
+# Event name keywords used to decide whether a higher reading is bullish
+_HIGHER_IS_BETTER_RE = re.compile(r'GDP|EMPLOYMENT|RETAIL|PMI|SALES|CONSUMER|CONFIDENCE')
+_LOWER_IS_BETTER_RE = re.compile(r'UNEMPLOYMENT|JOBLESS|CLAIMS|DEFICIT')
+_INFLATION_RE = re.compile(r'CPI|PPI|INFLATION')
+
+# Weight applied to each event surprise (high impact already filtered)
+_EVENT_WEIGHT = 3.0
+
+# Adjusted score thresholds and the strength reached at or above each one
+_STRENGTH_THRESHOLDS = (1.5, 3.0, 5.0, 8.0)
+_STRENGTH_LEVELS = (
+    SignalStrength.VERY_WEAK,
+    SignalStrength.WEAK,
+    SignalStrength.MODERATE,
+    SignalStrength.STRONG,
+    SignalStrength.VERY_STRONG,
+)
+
+
 @dataclass
 class FundamentalSignal:
     """Represents a fundamental analysis signal"""
@@ -67,14 +101,61 @@ class FundamentalAnalyzer:
     
     # Events that strongly affect each currency
     CURRENCY_EVENTS = {
-        'USD': ['NFP', 'CPI', 'FOMC', 'GDP', 'RETAIL_SALES', 'JOBLESS'],
-        'GBP': ['BOE', 'CPI', 'GDP', 'PMI', 'RETAIL'],
-        'EUR': ['ECB', 'CPI', 'GDP', 'PMI', 'ZEW', 'IFO'],
-        'JPY': ['BOJ', 'CPI', 'TANKAN', 'GDP']
+        'USD': frozenset({'NFP', 'CPI', 'FOMC', 'GDP', 'RETAIL_SALES', 'JOBLESS'}),
+        'GBP': frozenset({'BOE', 'CPI', 'GDP', 'PMI', 'RETAIL'}),
+        'EUR': frozenset({'ECB', 'CPI', 'GDP', 'PMI', 'ZEW', 'IFO'}),
+        'JPY': frozenset({'BOJ', 'CPI', 'TANKAN', 'GDP'})
     }
     
     def __init__(self):
         self.api = ForexFactoryAPI()
+        
+        # Today's news per (pairs, high_impact_only, date) -> (fetched_at, news)
+        self._news_cache: Dict[Tuple, Tuple[float, Dict[str, List[EconomicEvent]]]] = {}
+        self.news_cache_ttl = config.CACHE_TTL_SHORT
+    
+    def _get_news(
+        self,
+        pairs: List[CurrencyPair],
+        high_impact_only: bool = True
+    ) -> Dict[str, List[EconomicEvent]]:
+        """
+        Fetch relevant news, reusing a recent fetch for the same request
+        
+        Results are kept for `news_cache_ttl` seconds so that repeated
+        analysis calls within one run hit the calendar only once.
+        
+        Args:
+            pairs: List of currency pairs
+            high_impact_only: Filter to high impact only
+            
+        Returns:
+            Dictionary mapping pair names to relevant events
+        """
+        key = (
+            tuple(sorted(p.value for p in pairs)),
+            high_impact_only,
+            date.today().isoformat()
+        )
+        
+        cached = self._news_cache.get(key)
+        if cached is not None:
+            fetched_at, news = cached
+            if time.monotonic() - fetched_at < self.news_cache_ttl:
+                return news
+        
+        news = self.api.get_relevant_news(pairs, high_impact_only=high_impact_only)
+        
+        # Keep only live entries for today, so a long run does not collect
+        # every day's calendar
+        now = time.monotonic()
+        self._news_cache = {
+            k: v for k, v in self._news_cache.items()
+            if k[2] == key[2] and now - v[0] < self.news_cache_ttl
+        }
+        self._news_cache[key] = (now, news)
+        
+        return news
     
     def analyze_today(
         self,
@@ -92,31 +173,65 @@ class FundamentalAnalyzer:
         logger.info("Running fundamental analysis for today")
         
         # Fetch today's high-impact news
-        news = self.api.get_relevant_news(pairs, high_impact_only=True)
+        news = self._get_news(pairs, high_impact_only=True)
+        
+        return self._signals_from_news(pairs, news)
+    
+    async def analyze_today_async(
+        self,
+        pairs: List[CurrencyPair]
+    ) -> Dict[str, FundamentalSignal]:
+        """
+        Async variant of analyze_today for use inside an event loop
+        
+        The calendar fetch and the analysis run in a worker thread, so
+        other coroutines (e.g. Telegram sends) keep running meanwhile.
+        
+        Args:
+            pairs: List of currency pairs to analyze
+            
+        Returns:
+            Dictionary mapping pair name to FundamentalSignal
+        """
+        logger.info("Running fundamental analysis for today (async)")
+        
+        news = await asyncio.to_thread(self._get_news, pairs, True)
         
+        return await asyncio.to_thread(self._signals_from_news, pairs, news)
+    
+    def _signals_from_news(
+        self,
+        pairs: List[CurrencyPair],
+        news: Dict[str, List[EconomicEvent]]
+    ) -> Dict[str, FundamentalSignal]:
+        """Analyze each pair against already-fetched news"""
         signals = {}
         
+        # One timestamp for the whole batch
+        analysis_time = datetime.now()
+        
         for pair in pairs:
             pair_events = news.get(pair.value, [])
             
             if not pair_events:
-                logger.info(f"No high-impact news for {pair.value} today")
+                logger.info("No high-impact news for %s today", pair.value)
                 continue
             
             # Analyze the pair
-            signal = self._analyze_pair(pair, pair_events)
+            signal = self._analyze_pair(pair, pair_events, analysis_time)
             
             if signal:
                 signals[pair.value] = signal
-                logger.info(f"Generated fundamental signal for {pair.value}: "
-                          f"{signal.direction.value} (strength: {signal.strength.value})")
+                logger.info("Generated fundamental signal for %s: %s (strength: %s)",
+                          pair.value, signal.direction.value, signal.strength.value)
         
         return signals
     
     def _analyze_pair(
         self,
         pair: CurrencyPair,
-        events: List[EconomicEvent]
+        events: List[EconomicEvent],
+        analysis_time: Optional[datetime] = None
     ) -> Optional[FundamentalSignal]:
         """
         Analyze fundamental direction for a specific pair
@@ -124,6 +239,7 @@ class FundamentalAnalyzer:
         Args:
             pair: Currency pair
             events: List of economic events affecting this pair
+            analysis_time: Timestamp for the signal (defaults to now)
             
         Returns:
             FundamentalSignal or None
@@ -131,11 +247,23 @@ class FundamentalAnalyzer:
         base_currency = pair.base_currency
         quote_currency = pair.quote_currency
         
-        # Score each currency based on news
-        base_score = self._calculate_currency_score(base_currency, events)
-        quote_score = self._calculate_currency_score(quote_currency, events)
+        # Only released events (forecast and actual known) can be scored
+        scored_events = [
+            e for e in events
+            if e.forecast and e.actual and e.currency in (base_currency, quote_currency)
+        ]
+        
+        if not scored_events:
+            # Nothing released yet (e.g. pre-market) - skip scoring entirely
+            return None
+        
+        # Score both currencies in a single pass over the news
+        base_score, quote_score = self._calculate_pair_scores(
+            base_currency, quote_currency, scored_events
+        )
         
-        logger.debug(f"{pair.value} scores: {base_currency}={base_score}, {quote_currency}={quote_score}")
+        logger.debug("%s scores: %s=%s, %s=%s",
+                     pair.value, base_currency, base_score, quote_currency, quote_score)
         
         # Determine direction
         score_diff = base_score - quote_score
@@ -147,13 +275,13 @@ class FundamentalAnalyzer:
         # Determine direction and strength
         if score_diff > 0:
             # Base currency stronger
-            if pair.quote_currency == 'USD':
+            if quote_currency == 'USD':
                 direction = FundamentalDirection.USD_WEAKER
             else:
                 direction = FundamentalDirection.COUNTERPARTY_STRONGER
         else:
             # Quote currency stronger
-            if pair.quote_currency == 'USD':
+            if quote_currency == 'USD':
                 direction = FundamentalDirection.USD_STRONGER
             else:
                 direction = FundamentalDirection.COUNTERPARTY_WEAKER
@@ -169,113 +297,147 @@ class FundamentalAnalyzer:
             direction=direction,
             strength=strength,
             events=events,
-            analysis_time=datetime.now(),
+            analysis_time=analysis_time or datetime.now(),
             expected_impact=expected_impact
         )
         
         return signal
     
-    def _calculate_currency_score(
+    def _calculate_pair_scores(
         self,
-        currency: str,
+        base_currency: str,
+        quote_currency: str,
         events: List[EconomicEvent]
-    ) -> float:
+    ) -> Tuple[float, float]:
         """
-        Calculate currency strength score based on news
+        Calculate base and quote currency scores in one pass over the events
         
-        Positive score = currency strengthening
-        Negative score = currency weakening
+        Each event is parsed once and routed to the currency it belongs to.
         
         Args:
-            currency: Currency code (e.g., 'USD', 'GBP')
+            base_currency: Base currency code (e.g., 'GBP')
+            quote_currency: Quote currency code (e.g., 'USD')
             events: Economic events
             
         Returns:
-            Score (-10 to +10)
+            Tuple of (base_score, quote_score), each -10 to +10
         """
-        score = 0.0
-        
-        currency_events = [e for e in events if e.currency == currency]
+        # currency -> (actuals, forecasts, signs)
+        buckets = {
+            base_currency: ([], [], []),
+            quote_currency: ([], [], []),
+        }
         
-        for event in currency_events:
-            # Skip if no forecast or actual
-            if not event.forecast or not event.actual:
+        for event in events:
+            bucket = buckets.get(event.currency)
+            
+            # Skip other currencies and events without forecast or actual
+            if bucket is None or not event.forecast or not event.actual:
                 continue
             
-            try:
-                # Parse values (remove %, K, M, B suffixes)
-                actual = self._parse_economic_value(event.actual)
-                forecast = self._parse_economic_value(event.forecast)
-                
-                if actual is None or forecast is None:
-                    continue
-                
-                # Calculate surprise (actual - forecast)
-                surprise = actual - forecast
-                
-                # Determine if higher is better for this event
-                higher_is_better = self._is_higher_better(event.event_name)
-                
-                # Calculate impact
-                if higher_is_better:
-                    event_score = surprise
-                else:
-                    event_score = -surprise
-                
-                # Weight by event importance
-                weight = 3.0  # High impact already filtered
-                
-                score += event_score * weight
-                
-                logger.debug(f"{event.event_name} ({currency}): "
-                           f"actual={actual}, forecast={forecast}, score_contribution={event_score * weight}")
-                
-            except Exception as e:
-                logger.warning(f"Failed to parse event {event.event_name}: {e}")
+            parsed = self._parse_event(event)
+            if parsed is None:
                 continue
+            
+            for values, value in zip(bucket, parsed):
+                values.append(value)
+        
+        return (
+            self._reduce_score(*buckets[base_currency]),
+            self._reduce_score(*buckets[quote_currency]),
+        )
+    
+    def _parse_event(self, event: EconomicEvent) -> Optional[Tuple[float, float, float]]:
+        """
+        Parse an event into (actual, forecast, sign)
+        
+        sign is +1.0 when a higher reading strengthens the currency, -1.0 otherwise.
+        Returns None if the values cannot be parsed.
+        """
+        try:
+            # Parse values (remove %, K, M, B suffixes)
+            actual = self._parse_economic_value(event.actual)
+            forecast = self._parse_economic_value(event.forecast)
+            
+            if actual is None or forecast is None:
+                return None
+            
+            # Determine if higher is better for this event
+            sign = 1.0 if self._is_higher_better(event.event_name) else -1.0
+            
+            logger.debug("%s (%s): actual=%s, forecast=%s, score_contribution=%s",
+                         event.event_name, event.currency, actual, forecast,
+                         sign * (actual - forecast) * _EVENT_WEIGHT)
+            
+            return actual, forecast, sign
+            
+        except Exception as e:
+            logger.warning("Failed to parse event %s: %s", event.event_name, e)
+            return None
+    
+    def _reduce_score(
+        self,
+        actuals: List[float],
+        forecasts: List[float],
+        signs: List[float]
+    ) -> float:
+        """Sum weighted surprises and normalize to the -10 to +10 range"""
+        score = 0.0
+        for actual, forecast, sign in zip(actuals, forecasts, signs):
+            score += sign * (actual - forecast) * _EVENT_WEIGHT
         
         # Normalize score to -10 to +10 range
-        score = max(-10, min(10, score))
+        if score > 10.0:
+            return 10.0
+        if score < -10.0:
+            return -10.0
         
         return score
     
     def _parse_economic_value(self, value_str: str) -> Optional[float]:
-        """Parse economic value from string"""
-        if not value_str or value_str.strip() == '':
+        """Parse economic value from string (e.g. '3.2%', '1,250', '1.5K')"""
+        if not value_str:
             return None
         
-        # Remove common suffixes and symbols
-        value_str = value_str.replace('%', '').replace('K', '000').replace('M', '000000')
-        value_str = value_str.replace('B', '000000000').replace(',', '').strip()
+        # Drop '%' and thousands separators in one pass
+        value_str = value_str.strip().translate(_STRIP_CHARS)
+        if not value_str:
+            return None
+        
+        # Scale K/M/B suffixes instead of padding zeros ('1.5K' -> 1500.0)
+        multiplier = 1.0
+        if value_str.endswith(_SUFFIXES):
+            multiplier = _SUFFIX_MULTIPLIERS[value_str[-1]]
+            value_str = value_str[:-1]
         
         try:
-            return float(value_str)
+            return float(value_str) * multiplier
         except ValueError:
             return None
     
-    def _is_higher_better(self, event_name: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_higher_better(event_name: str) -> bool:
         """
         Determine if higher value is better for the currency
         
         Higher is better for: GDP, Employment, Retail Sales, PMI
         Lower is better for: Unemployment, Inflation (sometimes), Deficits
+        
+        Memoized: the set of calendar event names is small and recurs daily.
         """
         event_upper = event_name.upper()
         
+        # Lower is good (checked first: 'UNEMPLOYMENT' contains 'EMPLOYMENT')
+        if _LOWER_IS_BETTER_RE.search(event_upper):
+            return False
+        
         # Higher is good
-        if any(keyword in event_upper for keyword in [
-            'GDP', 'EMPLOYMENT', 'RETAIL', 'PMI', 'SALES', 'CONSUMER', 'CONFIDENCE'
-        ]):
+        if _HIGHER_IS_BETTER_RE.search(event_upper):
             return True
         
-        # Lower is good
-        if any(keyword in event_upper for keyword in [
-            'UNEMPLOYMENT', 'JOBLESS', 'CLAIMS', 'DEFICIT'
-        ]):
-            return False
-        
         # For inflation (CPI, PPI) - context dependent, assume higher is neutral/slightly negative
-        if any(keyword in event_upper for keyword in ['CPI', 'PPI', 'INFLATION']):
+        if _INFLATION_RE.search(event_upper):
             return False
         
         # Default: higher is better
@@ -285,19 +447,12 @@ class FundamentalAnalyzer:
         """Calculate signal strength based on score difference and event count"""
         
         # More events = stronger signal
-        event_multiplier = min(event_count / 3.0, 1.5)
+        event_multiplier = event_count / 3.0
+        if event_multiplier > 1.5:
+            event_multiplier = 1.5
         adjusted_score = score_diff * event_multiplier
         
-        if adjusted_score >= 8:
-            return SignalStrength.VERY_STRONG
-        elif adjusted_score >= 5:
-            return SignalStrength.STRONG
-        elif adjusted_score >= 3:
-            return SignalStrength.MODERATE
-        elif adjusted_score >= 1.5:
-            return SignalStrength.WEAK
-        else:
-            return SignalStrength.VERY_WEAK
+        return _STRENGTH_LEVELS[bisect.bisect_right(_STRENGTH_THRESHOLDS, adjusted_score)]
     
     def _generate_impact_description(
         self,
@@ -307,6 +462,7 @@ class FundamentalAnalyzer:
     ) -> str:
         """Generate human-readable impact description"""
         
+        base_currency = pair.base_currency
         event_names = [e.event_name for e in events[:3]]  # Top 3 events
         events_str = ', '.join(event_names)
         
@@ -315,9 +471,9 @@ class FundamentalAnalyzer:
         elif direction == FundamentalDirection.USD_WEAKER:
             return f"USD weakening due to {events_str}. Expect {pair.value} to move up."
         elif direction == FundamentalDirection.COUNTERPARTY_STRONGER:
-            return f"{pair.base_currency} strengthening due to {events_str}. Expect {pair.value} to move up."
+            return f"{base_currency} strengthening due to {events_str}. Expect {pair.value} to move up."
         else:
-            return f"{pair.base_currency} weakening due to {events_str}. Expect {pair.value} to move down."
+            return f"{base_currency} weakening due to {events_str}. Expect {pair.value} to move down."
     
     def should_trade_today(self, pair: CurrencyPair) -> bool:
         """
@@ -325,8 +481,20 @@ class FundamentalAnalyzer:
         
         Returns True if there are high-impact news events
         """
-        news = self.api.get_relevant_news([pair], high_impact_only=True)
-        return len(news.get(pair.value, [])) > 0
+        return self.should_trade_today_batch([pair])[pair.value]
+    
+    def should_trade_today_batch(self, pairs: List[CurrencyPair]) -> Dict[str, bool]:
+        """
+        Check several pairs at once with a single news fetch
+        
+        Args:
+            pairs: List of currency pairs to check
+            
+        Returns:
+            Dictionary mapping pair name to True if it has high-impact news today
+        """
+        news = self._get_news(pairs, high_impact_only=True)
+        return {p.value: len(news.get(p.value, [])) > 0 for p in pairs}
 
 
 def main():
@@ -370,10 +538,10 @@ def main():
         
         # Test 2: Check if should trade
         print("\nTest 2: Checking if pairs are tradeable today...")
-        for pair in pairs:
-            tradeable = analyzer.should_trade_today(pair)
+        tradeable_pairs = analyzer.should_trade_today_batch(pairs)
+        for pair_name, tradeable in tradeable_pairs.items():
             status = "✅ YES" if tradeable else "❌ NO"
-            print(f"{pair.value}: {status}")
+            print(f"{pair_name}: {status}")
         
         print("\n" + "="*60)
         print("✅ FUNDAMENTAL ANALYZER TEST COMPLETE!")
@@ -4,24 +4,200 @@ Liquidity Zone Detection Module
 
 import pandas as pd
 import numpy as np
+import heapq
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+    bn = None
+
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root, for running this module as a script; added only once
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core.enums import CurrencyPair, TimeFrame, LiquidityZoneType
 from core.exceptions import LiquidityZoneError
 from core.config import config
 from data import MarketDataFetcher
+from analysis._numba_kernels import (
+    NUMBA_AVAILABLE,
+    group_equal_levels,
+    make_stop_hunt_scanner,
+    make_zone_scanner,
+    rolling_extremes,
+)
 
 logger = logging.getLogger(__name__)
 
+# Zone types bound once for the zone-building comprehensions
+_EQUAL_HIGHS = LiquidityZoneType.EQUAL_HIGHS
+_EQUAL_LOWS = LiquidityZoneType.EQUAL_LOWS
+_STOP_HUNT_BUY = LiquidityZoneType.STOP_HUNT_BUY
+_STOP_HUNT_SELL = LiquidityZoneType.STOP_HUNT_SELL
+_FVG_BULLISH = LiquidityZoneType.FAIR_VALUE_GAP_BULLISH
+_FVG_BEARISH = LiquidityZoneType.FAIR_VALUE_GAP_BEARISH
 
-@dataclass
+
+def _rolling_extremes(values: np.ndarray, window: int, find_highs: bool) -> np.ndarray:
+    """
+    Max (or min) of every full `window`-bar window
+    
+    Element k covers values[k:k + window]. Uses an O(N) monotonic-deque
+    algorithm - bottleneck's move_max/move_min when installed, else the
+    compiled rolling_extremes kernel - and falls back to a NumPy
+    reduction over a strided window view.
+    
+    Args:
+        values: Price array, at least `window` long
+        window: Window size
+        find_highs: True for rolling max, False for rolling min
+        
+    Returns:
+        Array of len(values) - window + 1 extremes
+    """
+    if BOTTLENECK_AVAILABLE:
+        move = bn.move_max if find_highs else bn.move_min
+        return move(values, window)[window - 1:]
+    
+    if NUMBA_AVAILABLE:
+        return rolling_extremes(values, window, find_highs)
+    
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    return windows.max(axis=1) if find_highs else windows.min(axis=1)
+
+
+def _swing_points(values: np.ndarray, window: int, find_highs: bool) -> np.ndarray:
+    """
+    Find swing points with a centered rolling window
+    
+    A bar is a swing high (low) when it equals the max (min) of the
+    `window` bars centered on it - the same rule as
+    `rolling(window, center=True).max()`, computed on the raw array
+    without building pandas intermediates.
+    
+    Args:
+        values: High (or low) prices
+        window: Rolling window size
+        find_highs: True for swing highs, False for swing lows
+        
+    Returns:
+        Integer positions of the swing points
+    """
+    if len(values) < window:
+        return np.empty(0, dtype=np.intp)
+    
+    extremes = _rolling_extremes(values, window, find_highs)
+    
+    # Window k covers bars k..k+window-1 and is labelled at its center
+    offset = (window - 1) // 2
+    centered = values[offset:offset + len(extremes)]
+    
+    return np.flatnonzero(centered == extremes) + offset
+
+
+def _group_equal_levels(
+    levels: np.ndarray,
+    tolerance: float,
+    min_touches: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group price levels that lie within `tolerance` of each other
+    
+    Levels are visited in their original (chronological) order. Each level
+    not yet grouped becomes an anchor and collects every ungrouped level
+    within `tolerance` of it. Sorting the levels once lets each anchor
+    look only at its own price window (located with searchsorted), and
+    grouped levels are skipped through a next-free pointer table, so the
+    whole pass is O(n log n) rather than a pairwise comparison.
+    
+    Args:
+        levels: Swing prices in chronological order
+        tolerance: Maximum relative distance from the anchor
+        min_touches: Minimum group size to report
+        
+    Returns:
+        Tuple of (anchors, members, starts): the anchor index of each
+        reported group, the member indices of all groups concatenated
+        (chronological within a group), and the offset of each group in
+        `members` - the segment layout np.ufunc.reduceat expects
+    """
+    if NUMBA_AVAILABLE:
+        return group_equal_levels(levels, tolerance, min_touches)
+    
+    count = len(levels)
+    order = np.argsort(levels, kind='stable')
+    sorted_levels = levels[order]
+    
+    # Slightly widened windows; the exact relative test below decides membership
+    window_start = np.searchsorted(sorted_levels, levels * (1 - tolerance) * (1 - 1e-9), side='left')
+    window_end = np.searchsorted(sorted_levels, levels * (1 + tolerance) * (1 + 1e-9), side='right')
+    
+    values = levels.tolist()
+    sorted_to_level = order.tolist()
+    rank = np.empty(count, dtype=np.intp)
+    rank[order] = np.arange(count)
+    rank = rank.tolist()
+    
+    # next_free[k] chains to the first ungrouped sorted slot at or after k
+    next_free = list(range(count + 1))
+    
+    def find_free(k: int) -> int:
+        root = k
+        while next_free[root] != root:
+            root = next_free[root]
+        while next_free[k] != root:
+            next_free[k], k = root, next_free[k]
+        return root
+    
+    grouped = [False] * count
+    anchors = []
+    grouped_members = []
+    starts = []
+    
+    for anchor in range(count):
+        if grouped[anchor]:
+            continue
+        
+        anchor_level = values[anchor]
+        members = []
+        end = window_end[anchor]
+        k = find_free(window_start[anchor])
+        
+        while k < end:
+            j = sorted_to_level[k]
+            if abs(values[j] - anchor_level) / anchor_level <= tolerance:
+                members.append(j)
+                grouped[j] = True
+                next_free[k] = k + 1
+            k = find_free(k + 1)
+        
+        if len(members) >= min_touches:
+            members.sort()
+            anchors.append(anchor)
+            starts.append(len(grouped_members))
+            grouped_members.extend(members)
+    
+    return (
+        np.array(anchors, dtype=np.intp),
+        np.array(grouped_members, dtype=np.intp),
+        np.array(starts, dtype=np.intp),
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class LiquidityZone:
     zone_type: LiquidityZoneType
     price_level: float
@@ -47,233 +223,541 @@ class LiquidityZone:
                 self.price_range[1] * (1 + tolerance))
 
 
+def _round_prices(values: np.ndarray, decimals: int = 5) -> List[float]:
+    """
+    round(v, decimals) for every value, vectorized
+    
+    np.round scales before rounding, so values within rounding error of
+    a half step can land on the other side of Python's correctly rounded
+    round(). Those few are rounded with round() itself.
+    """
+    scale = 10.0 ** decimals
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    for i in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6).tolist():
+        rounded[i] = round(float(values[i]), decimals)
+    return rounded.tolist()
+
+
+def zones_to_dicts(zones: List[LiquidityZone]) -> List[Dict]:
+    """
+    Same as [z.to_dict() for z in zones], with prices rounded in batches
+    
+    Prices are gathered into arrays and rounded once per field instead
+    of three round() calls per zone.
+    """
+    levels = _round_prices(np.fromiter((z.price_level for z in zones), dtype=np.float64, count=len(zones)))
+    bounds = np.array([z.price_range for z in zones], dtype=np.float64).reshape(-1, 2)
+    lows = _round_prices(bounds[:, 0])
+    highs = _round_prices(bounds[:, 1])
+    return [
+        {
+            'type': z.zone_type.value,
+            'price_level': level,
+            'price_range': [low, high],
+            'strength': z.strength,
+            'touches': z.touches,
+            'time_detected': z.time_detected.isoformat(),
+            'candle_index': z.candle_index
+        }
+        for z, level, low, high in zip(zones, levels, lows, highs)
+    ]
+
+
+def _stop_hunt_zones(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    labels: pd.Index,
+    positions: np.ndarray,
+    kinds: np.ndarray,
+    offset: int
+) -> List[LiquidityZone]:
+    """Stop-hunt zones for scanner hits (+1 buy-side, -1 sell-side)"""
+    buy = kinds > 0
+    levels = np.where(buy, lows[positions], highs[positions])
+    range_low = np.where(buy, levels, levels * 0.999)
+    range_high = np.where(buy, levels * 1.001, levels)
+    
+    fields = zip(buy.tolist(), levels.tolist(), range_low.tolist(), range_high.tolist(),
+                 labels[positions], (positions + offset).tolist())
+    return [
+        LiquidityZone(
+            zone_type=_STOP_HUNT_BUY if is_buy else _STOP_HUNT_SELL,
+            price_level=level,
+            price_range=(low, high),
+            strength=4,
+            touches=1,
+            time_detected=label,
+            candle_index=index
+        )
+        for is_buy, level, low, high, label, index in fields
+    ]
+
+
+def _fair_value_gap_zones(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    labels: pd.Index,
+    positions: np.ndarray,
+    kinds: np.ndarray,
+    offset: int
+) -> List[LiquidityZone]:
+    """FVG zones for stencil hits at candle 3 (+1 bullish, -1 bearish)"""
+    bullish = kinds > 0
+    
+    # The gap spans candle 1's high to candle 3's low (bullish) or
+    # candle 3's high to candle 1's low (bearish)
+    range_low = np.where(bullish, highs[positions - 2], highs[positions])
+    range_high = np.where(bullish, lows[positions], lows[positions - 2])
+    levels = (range_low + range_high) / 2
+    
+    fields = zip(bullish.tolist(), levels.tolist(), range_low.tolist(), range_high.tolist(),
+                 labels[positions], (positions + offset).tolist())
+    return [
+        LiquidityZone(
+            zone_type=_FVG_BULLISH if is_bullish else _FVG_BEARISH,
+            price_level=level,
+            price_range=(low, high),
+            strength=3,
+            touches=0,
+            time_detected=label,
+            candle_index=index
+        )
+        for is_bullish, level, low, high, label, index in fields
+    ]
+
+
+@dataclass(slots=True, frozen=True)
+class _OHLCArrays:
+    """
+    OHLC columns of a frame as NumPy arrays
+    
+    Built once per scan so the detectors work on plain arrays instead of
+    pulling columns out of the DataFrame each time. Rows are open, high,
+    low, close; each row is contiguous.
+    """
+    prices: np.ndarray
+    labels: pd.Index
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> '_OHLCArrays':
+        prices = np.ascontiguousarray(df[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64).T)
+        return cls(prices=prices, labels=df.index)
+    
+    def __len__(self) -> int:
+        return len(self.labels)
+    
+    @property
+    def highs(self) -> np.ndarray:
+        return self.prices[1]
+    
+    @property
+    def lows(self) -> np.ndarray:
+        return self.prices[2]
+    
+    def tail(self, start: int) -> '_OHLCArrays':
+        """Views of the bars from position `start` on"""
+        return _OHLCArrays(prices=self.prices[:, start:], labels=self.labels[start:])
+
+
+def _ohlc_arrays(data: Union[pd.DataFrame, _OHLCArrays]) -> _OHLCArrays:
+    return data if isinstance(data, _OHLCArrays) else _OHLCArrays.from_frame(data)
+
+
+@dataclass
+class _ScanState:
+    """
+    Bar-level detections from the last scan of one pair/timeframe
+    
+    Lets the next scan skip bars it has already seen. Only the final bar
+    is assumed to still be forming; earlier bars are treated as final.
+    """
+    first_bar: pd.Timestamp
+    last_bar: pd.Timestamp
+    last_values: Tuple[float, ...]
+    length: int
+    swing_highs: np.ndarray
+    swing_lows: np.ndarray
+    stop_hunts: List[LiquidityZone]
+    fair_value_gaps: List[LiquidityZone]
+    zones: List[LiquidityZone]
+    
+    def extends(self, labels: pd.Index) -> bool:
+        """True if labels start with the bars that were scanned"""
+        return (
+            len(labels) >= self.length
+            and labels[0] == self.first_bar
+            and labels[self.length - 1] == self.last_bar
+        )
+    
+    def is_current(self, df: pd.DataFrame) -> bool:
+        """True if df holds exactly the bars that were scanned"""
+        return (
+            len(df) == self.length
+            and self.extends(df.index)
+            and _last_bar_values(df) == self.last_values
+        )
+
+
+def _last_bar_values(df: pd.DataFrame) -> Tuple[float, ...]:
+    return tuple(df[['open', 'high', 'low', 'close']].iloc[-1].tolist())
+
+
 class LiquidityZoneDetector:
     def __init__(self):
         self.fetcher = MarketDataFetcher()
         self.equal_level_tolerance = config.EQUAL_LEVEL_TOLERANCE
         self.min_touches = config.MIN_TOUCHES
         self.swing_detection_window = 5
+        self.stop_hunt_lookback = 20
+        self.fetch_cache_ttl = config.CACHE_TTL_SHORT
+        # Per-instance memo; exceptions are not cached, so failed fetches retry
+        self._fetch_memo = functools.lru_cache(maxsize=32)(self._fetch_for_bucket)
+        self._scan_states: Dict[Tuple[CurrencyPair, TimeFrame], _ScanState] = {}
+        
+        if NUMBA_AVAILABLE:
+            # Compile (or load) the specialized scanners now, not on the first scan
+            make_zone_scanner(self.stop_hunt_lookback, self.swing_detection_window)
+            make_stop_hunt_scanner(self.stop_hunt_lookback)
+    
+    def _fetch_bucket(self) -> int:
+        return int(time.time() // self.fetch_cache_ttl)
+    
+    def _fetch_for_bucket(self, pair: CurrencyPair, timeframe: TimeFrame, bucket: int) -> pd.DataFrame:
+        return self.fetcher.fetch_data(pair, timeframe)
+    
+    def _cached_fetch(self, pair: CurrencyPair, timeframe: TimeFrame, bucket: Optional[int]) -> pd.DataFrame:
+        """
+        Fetch market data, reusing the result within a TTL bucket
+        
+        The bucket is part of the cache key, so entries go stale every
+        `fetch_cache_ttl` seconds without explicit eviction. Callers that
+        need fresh data should pass bucket=None to bypass the cache.
+        The returned DataFrame is shared between callers and must not be
+        modified in place.
+        """
+        if bucket is None:
+            return self.fetcher.fetch_data(pair, timeframe)
+        return self._fetch_memo(pair, timeframe, bucket)
     
     def detect_all_zones(self, pair: CurrencyPair, timeframe: TimeFrame) -> List[LiquidityZone]:
-        logger.info(f'Detecting liquidity zones for {pair.value} on {timeframe.value}')
+        logger.info('Detecting liquidity zones for %s on %s', pair.value, timeframe.value)
         
         try:
-            df = self.fetcher.fetch_data(pair, timeframe)
+            df = self._cached_fetch(pair, timeframe, self._fetch_bucket())
+            key = (pair, timeframe)
+            state = self._scan_states.get(key)
+            
+            if state is not None and state.is_current(df):
+                logger.info('No new bars, reusing %d liquidity zones', len(state.zones))
+                # A copy, so callers that reorder their list cannot alter the state
+                return list(state.zones)
+            
             zones = []
+            bars = _OHLCArrays.from_frame(df)
+            
+            high_positions, low_positions, stop_hunts, fvgs = self._scan_bars(bars, state)
             
-            equal_highs = self._detect_equal_highs(df)
-            equal_lows = self._detect_equal_lows(df)
+            equal_highs, equal_lows = self._detect_equal_levels(bars, swing_points=(high_positions, low_positions))
             zones.extend(equal_highs)
             zones.extend(equal_lows)
-            
-            stop_hunts = self._detect_stop_hunts(df)
             zones.extend(stop_hunts)
-            
-            fvgs = self._detect_fair_value_gaps(df)
             zones.extend(fvgs)
             
-            zones.sort(key=lambda z: z.strength, reverse=True)
+            # Strongest first; stable so equal strengths keep detector order
+            strengths = np.fromiter((z.strength for z in zones), dtype=np.int16, count=len(zones))
+            zones = [zones[i] for i in np.argsort(-strengths, kind='stable').tolist()]
+            self._scan_states[key] = _ScanState(
+                first_bar=df.index[0],
+                last_bar=df.index[-1],
+                last_values=_last_bar_values(df),
+                length=len(df),
+                swing_highs=high_positions,
+                swing_lows=low_positions,
+                stop_hunts=stop_hunts,
+                fair_value_gaps=fvgs,
+                zones=zones
+            )
             
-            logger.info(f'Detected {len(zones)} liquidity zones')
+            logger.info('Detected %d liquidity zones', len(zones))
             
-            return zones
+            return list(zones)
             
         except Exception as e:
             logger.error(f'Liquidity zone detection failed: {e}')
             raise LiquidityZoneError(pair=pair.value, zone_type='all', reason=str(e))
     
-    def _detect_equal_highs(self, data: pd.DataFrame, tolerance: float = None) -> List[LiquidityZone]:
-        if tolerance is None:
-            tolerance = self.equal_level_tolerance
+    def detect_all_zones_batch(self, pairs: List[CurrencyPair], timeframe: TimeFrame) -> Dict[str, List[LiquidityZone]]:
+        """
+        Detect zones for several pairs concurrently
         
-        zones = []
+        Each pair is fetched and scanned on its own worker thread. The
+        fetches are network-bound and the compiled stop-hunt kernel runs
+        without the GIL, so pairs overlap instead of queueing.
         
-        swing_highs = data[data['high'] == data['high'].rolling(
-            window=self.swing_detection_window, center=True).max()].copy()
-        
-        if len(swing_highs) < 2:
-            return zones
+        Args:
+            pairs: Currency pairs to analyze
+            timeframe: Timeframe shared by all pairs
+            
+        Returns:
+            Dictionary mapping pair name to its zones, strongest first
+            
+        Raises:
+            LiquidityZoneError: If detection fails for any pair
+        """
+        results = self.detect_batch(pairs, [timeframe])
+        return {pair: zones for (pair, _), zones in results.items()}
+    
+    def detect_batch(
+        self,
+        pairs: List[CurrencyPair],
+        timeframes: List[TimeFrame]
+    ) -> Dict[Tuple[str, str], List[LiquidityZone]]:
+        """
+        Detect zones for every pair/timeframe combination concurrently
         
-        swing_highs_list = [(idx, row['high']) for idx, row in swing_highs.iterrows()]
-        processed = set()
+        Each combination is fetched and scanned on its own worker thread;
+        scan state is kept per combination, so workers share nothing but
+        the fetch cache.
         
-        for i, (current_idx, current_high) in enumerate(swing_highs_list):
-            if i in processed:
-                continue
+        Args:
+            pairs: Currency pairs to analyze
+            timeframes: Timeframes to analyze each pair on
             
-            similar_highs = []
-            similar_indices = []
+        Returns:
+            Dictionary mapping (pair name, timeframe name) to its zones,
+            strongest first, in pair-major order
             
-            for j, (compare_idx, compare_high) in enumerate(swing_highs_list):
-                if j in processed:
-                    continue
-                
-                if abs(compare_high - current_high) / current_high <= tolerance:
-                    similar_highs.append(compare_high)
-                    similar_indices.append(compare_idx)
-                    processed.add(j)
-            
-            if len(similar_highs) >= self.min_touches:
-                avg_level = sum(similar_highs) / len(similar_highs)
-                
-                zone = LiquidityZone(
-                    zone_type=LiquidityZoneType.EQUAL_HIGHS,
-                    price_level=avg_level,
-                    price_range=(min(similar_highs), max(similar_highs)),
-                    strength=min(len(similar_highs), 5),
-                    touches=len(similar_highs),
-                    time_detected=current_idx,
-                    candle_index=data.index.get_loc(current_idx)
-                )
-                
-                zones.append(zone)
-        
-        return zones
-        
-    def _detect_equal_lows(self, data: pd.DataFrame, tolerance: float = None) -> List[LiquidityZone]:
+        Raises:
+            LiquidityZoneError: If detection fails for any combination
+        """
+        jobs = [(pair, timeframe) for pair in pairs for timeframe in timeframes]
+        if not jobs:
+            return {}
+        
+        # Capped like generate_signals: each job makes its own market data request
+        with ThreadPoolExecutor(max_workers=min(len(jobs), 8)) as executor:
+            results = executor.map(lambda job: self.detect_all_zones(*job), jobs)
+            return {(pair.value, timeframe.value): zones for (pair, timeframe), zones in zip(jobs, results)}
+    
+    def _scan_bars(
+        self,
+        bars: _OHLCArrays,
+        state: Optional[_ScanState]
+    ) -> Tuple[np.ndarray, np.ndarray, List[LiquidityZone], List[LiquidityZone]]:
+        """
+        Swing points, stop hunts and FVGs for the bars
+        
+        When the bars extend the previously scanned frame, cached stop hunts
+        and FVGs that cannot see the old last bar are kept and only the
+        tail is scanned again. Otherwise, with numba available, all bar
+        stencils run in one fused pass over the OHLC arrays.
+        
+        Returns:
+            Tuple of (swing high positions, swing low positions,
+            stop-hunt zones, FVG zones)
+        """
+        if state is not None and state.extends(bars.labels):
+            return self._scan_new_bars(bars, state)
+        
+        if NUMBA_AVAILABLE:
+            return self._scan_bars_jit(bars)
+        
+        high_positions, low_positions = self._detect_swing_points(bars)
+        return high_positions, low_positions, self._detect_stop_hunts(bars), self._detect_fair_value_gaps(bars)
+    
+    def _scan_bars_jit(self, bars: _OHLCArrays) -> Tuple[np.ndarray, np.ndarray, List[LiquidityZone], List[LiquidityZone]]:
+        """All bar stencils in a single pass of the compiled zone scanner"""
+        scan_zones = make_zone_scanner(self.stop_hunt_lookback, self.swing_detection_window)
+        high_positions, low_positions, hunt_positions, hunt_kinds, gap_positions, gap_kinds = scan_zones(
+            *bars.prices,
+            config.FVG_MIN_SIZE
+        )
+        
+        stop_hunts = _stop_hunt_zones(bars.highs, bars.lows, bars.labels, hunt_positions, hunt_kinds, 0)
+        fvgs = _fair_value_gap_zones(bars.highs, bars.lows, bars.labels, gap_positions, gap_kinds, 0)
+        return high_positions, low_positions, stop_hunts, fvgs
+    
+    def _scan_new_bars(
+        self,
+        bars: _OHLCArrays,
+        state: _ScanState
+    ) -> Tuple[np.ndarray, np.ndarray, List[LiquidityZone], List[LiquidityZone]]:
+        """Rescan only the new bars, plus whatever reads the old (possibly changed) last bar"""
+        # The old last bar may have changed since it was scanned
+        dirty = state.length - 1
+        
+        # A swing point at bar i reads the `window` bars centered on it
+        offset = (self.swing_detection_window - 1) // 2
+        swings_from = max(dirty - (self.swing_detection_window - 1 - offset), 0)
+        start = max(swings_from - offset, 0)
+        new_highs, new_lows = self._detect_swing_points(bars.tail(start))
+        high_positions = np.concatenate((
+            state.swing_highs[state.swing_highs < swings_from],
+            new_highs[new_highs + start >= swings_from] + start
+        ))
+        low_positions = np.concatenate((
+            state.swing_lows[state.swing_lows < swings_from],
+            new_lows[new_lows + start >= swings_from] + start
+        ))
+        
+        # A stop hunt at bar i also reads bar i + 1 and the `lookback` bars before it
+        hunts_from = max(dirty - 1, 0)
+        start = max(hunts_from - self.stop_hunt_lookback, 0)
+        stop_hunts = [z for z in state.stop_hunts if z.candle_index < hunts_from]
+        stop_hunts.extend(
+            z for z in self._detect_stop_hunts(bars.tail(start), offset=start)
+            if z.candle_index >= hunts_from
+        )
+        
+        # An FVG at bar i reads bars i-2..i
+        start = max(dirty - 2, 0)
+        fvgs = [z for z in state.fair_value_gaps if z.candle_index < dirty]
+        fvgs.extend(
+            z for z in self._detect_fair_value_gaps(bars.tail(start), offset=start)
+            if z.candle_index >= dirty
+        )
+        
+        return high_positions, low_positions, stop_hunts, fvgs
+    
+    def _detect_swing_points(self, data: Union[pd.DataFrame, _OHLCArrays]) -> Tuple[np.ndarray, np.ndarray]:
+        bars = _ohlc_arrays(data)
+        high_positions = _swing_points(bars.highs, self.swing_detection_window, find_highs=True)
+        low_positions = _swing_points(bars.lows, self.swing_detection_window, find_highs=False)
+        return high_positions, low_positions
+    
+    def _detect_equal_levels(
+        self,
+        data: Union[pd.DataFrame, _OHLCArrays],
+        tolerance: float = None,
+        swing_points: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Tuple[List[LiquidityZone], List[LiquidityZone]]:
         if tolerance is None:
             tolerance = self.equal_level_tolerance
         
-        zones = []
+        bars = _ohlc_arrays(data)
+        if swing_points is None:
+            swing_points = self._detect_swing_points(bars)
+        high_positions, low_positions = swing_points
         
-        swing_lows = data[data['low'] == data['low'].rolling(
-            window=self.swing_detection_window, center=True).min()].copy()
+        equal_highs = self._cluster_levels(bars.highs, high_positions, bars.labels, _EQUAL_HIGHS, tolerance)
+        equal_lows = self._cluster_levels(bars.lows, low_positions, bars.labels, _EQUAL_LOWS, tolerance)
         
-        if len(swing_lows) < 2:
-            return zones
+        return equal_highs, equal_lows
+    
+    def _cluster_levels(
+        self,
+        values: np.ndarray,
+        positions: np.ndarray,
+        labels: pd.Index,
+        zone_type: LiquidityZoneType,
+        tolerance: float
+    ) -> List[LiquidityZone]:
+        if len(positions) < 2:
+            return []
         
-        swing_lows_list = [(idx, row['low']) for idx, row in swing_lows.iterrows()]
-        processed = set()
+        levels = values[positions]
+        anchors, members, starts = _group_equal_levels(levels, tolerance, self.min_touches)
         
-        for i, (current_idx, current_low) in enumerate(swing_lows_list):
-            if i in processed:
-                continue
-            
-            similar_lows = []
-            similar_indices = []
-            
-            for j, (compare_idx, compare_low) in enumerate(swing_lows_list):
-                if j in processed:
-                    continue
-                
-                if abs(compare_low - current_low) / current_low <= tolerance:
-                    similar_lows.append(compare_low)
-                    similar_indices.append(compare_idx)
-                    processed.add(j)
-            
-            if len(similar_lows) >= self.min_touches:
-                avg_level = sum(similar_lows) / len(similar_lows)
-                
-                zone = LiquidityZone(
-                    zone_type=LiquidityZoneType.EQUAL_LOWS,
-                    price_level=avg_level,
-                    price_range=(min(similar_lows), max(similar_lows)),
-                    strength=min(len(similar_lows), 5),
-                    touches=len(similar_lows),
-                    time_detected=current_idx,
-                    candle_index=data.index.get_loc(current_idx)
-                )
-                
-                zones.append(zone)
-        
-        return zones
-    
-    def _detect_stop_hunts(self, df: pd.DataFrame) -> List[LiquidityZone]:
-        zones = []
-        lookback = 20
-        
-        for i in range(lookback, len(df) - 1):
-            candle = df.iloc[i]
-            next_candle = df.iloc[i+1]
-            
-            recent_high = df.iloc[i-lookback:i]['high'].max()
-            recent_low = df.iloc[i-lookback:i]['low'].min()
-            
-            if (candle['low'] < recent_low and 
-                candle['close'] > candle['open'] and 
-                next_candle['close'] > candle['close']):
-                
-                zone = LiquidityZone(
-                    zone_type=LiquidityZoneType.STOP_HUNT_BUY,
-                    price_level=candle['low'],
-                    price_range=(candle['low'], candle['low'] * 1.001),
-                    strength=4,
-                    touches=1,
-                    time_detected=candle.name,
-                    candle_index=i
-                )
-                zones.append(zone)
-            
-            elif (candle['high'] > recent_high and 
-                  candle['close'] < candle['open'] and 
-                  next_candle['close'] < candle['close']):
-                
-                zone = LiquidityZone(
-                    zone_type=LiquidityZoneType.STOP_HUNT_SELL,
-                    price_level=candle['high'],
-                    price_range=(candle['high'] * 0.999, candle['high']),
-                    strength=4,
-                    touches=1,
-                    time_detected=candle.name,
-                    candle_index=i
-                )
-                zones.append(zone)
-        
-        return zones
-    
-    def _detect_fair_value_gaps(self, df: pd.DataFrame) -> List[LiquidityZone]:
-        zones = []
+        if len(anchors) == 0:
+            return []
+        
+        # Per-group statistics in one segmented reduction each
+        similar = levels[members]
+        counts = np.diff(starts, append=len(members))
+        lows = np.minimum.reduceat(similar, starts)
+        highs = np.maximum.reduceat(similar, starts)
+        
+        # Means summed left to right like sum(); np.add.reduceat switches to
+        # pairwise summation on longer groups and can differ in the last bit
+        values_list = similar.tolist()
+        bounds = np.append(starts, len(members)).tolist()
+        means = [sum(values_list[start:end]) / (end - start) for start, end in zip(bounds, bounds[1:])]
+        anchor_positions = positions[anchors]
+        
+        groups = zip(anchor_positions.tolist(), means, lows.tolist(), highs.tolist(),
+                     counts.tolist(), labels[anchor_positions])
+        return [
+            LiquidityZone(
+                zone_type=zone_type,
+                price_level=mean,
+                price_range=(low, high),
+                strength=min(touches, 5),
+                touches=touches,
+                time_detected=label,
+                candle_index=position
+            )
+            for position, mean, low, high, touches, label in groups
+        ]
+    
+    def _detect_stop_hunts(self, data: Union[pd.DataFrame, _OHLCArrays], offset: int = 0) -> List[LiquidityZone]:
+        lookback = self.stop_hunt_lookback
+        bars = _ohlc_arrays(data)
+        
+        if NUMBA_AVAILABLE:
+            return self._detect_stop_hunts_jit(bars, lookback, offset)
+        
+        n = len(bars)
+        if n < lookback + 2:
+            return []
+        
+        opens, highs, lows, closes = bars.prices
+        
+        # Range of the `lookback` bars before each candidate bar i, i.e.
+        # highs[i-lookback:i].max(), for i in lookback..n-2
+        recent_high = _rolling_extremes(highs[:-2], lookback, find_highs=True)
+        recent_low = _rolling_extremes(lows[:-2], lookback, find_highs=False)
+        
+        candidates = slice(lookback, n - 1)
+        open_, close = opens[candidates], closes[candidates]
+        next_close = closes[lookback + 1:]
+        
+        buy = (lows[candidates] < recent_low) & (close > open_) & (next_close > close)
+        sell = ~buy & (highs[candidates] > recent_high) & (close < open_) & (next_close < close)
+        
+        hits = np.flatnonzero(buy | sell)
+        kinds = np.where(buy[hits], 1, -1)
+        return _stop_hunt_zones(bars.highs, bars.lows, bars.labels, hits + lookback, kinds, offset)
+    
+    def _detect_stop_hunts_jit(self, bars: _OHLCArrays, lookback: int, offset: int = 0) -> List[LiquidityZone]:
+        """Stop-hunt detection via the compiled scanner specialized for this lookback"""
+        scan_stop_hunts = make_stop_hunt_scanner(lookback)
+        positions, kinds = scan_stop_hunts(*bars.prices)
+        return _stop_hunt_zones(bars.highs, bars.lows, bars.labels, positions, kinds, offset)
+    
+    def _detect_fair_value_gaps(self, data: Union[pd.DataFrame, _OHLCArrays], offset: int = 0) -> List[LiquidityZone]:
         min_gap_size = config.FVG_MIN_SIZE
+        bars = _ohlc_arrays(data)
         
-        for i in range(2, len(df)):
-            candle1 = df.iloc[i-2]
-            candle3 = df.iloc[i]
-            
-            if candle1['high'] < candle3['low']:
-                gap_size = (candle3['low'] - candle1['high']) / candle1['high']
-                
-                if gap_size >= min_gap_size:
-                    zone = LiquidityZone(
-                        zone_type=LiquidityZoneType.FAIR_VALUE_GAP_BULLISH,
-                        price_level=(candle1['high'] + candle3['low']) / 2,
-                        price_range=(candle1['high'], candle3['low']),
-                        strength=3,
-                        touches=0,
-                        time_detected=candle3.name,
-                        candle_index=i
-                    )
-                    zones.append(zone)
-            
-            elif candle1['low'] > candle3['high']:
-                gap_size = (candle1['low'] - candle3['high']) / candle3['high']
-                
-                if gap_size >= min_gap_size:
-                    zone = LiquidityZone(
-                        zone_type=LiquidityZoneType.FAIR_VALUE_GAP_BEARISH,
-                        price_level=(candle1['low'] + candle3['high']) / 2,
-                        price_range=(candle3['high'], candle1['low']),
-                        strength=3,
-                        touches=0,
-                        time_detected=candle3.name,
-                        candle_index=i
-                    )
-                    zones.append(zone)
-        
-        return zones
+        # Three-candle stencil: candle 1 = bar i-2, candle 3 = bar i
+        high1, low1 = bars.highs[:-2], bars.lows[:-2]
+        high3, low3 = bars.highs[2:], bars.lows[2:]
+        
+        # Gap sizes only where the candles actually leave a gap; most bars don't
+        bullish = np.flatnonzero(high1 < low3)
+        bullish = bullish[(low3[bullish] - high1[bullish]) / high1[bullish] >= min_gap_size]
+        bearish = np.flatnonzero(low1 > high3)
+        bearish = bearish[(low1[bearish] - high3[bearish]) / high3[bearish] >= min_gap_size]
+        
+        # A bar cannot gap both ways, so a stable sort restores bar order
+        gaps = np.concatenate((bullish, bearish))
+        kinds = np.concatenate((np.ones(len(bullish), dtype=np.int8), np.full(len(bearish), -1, dtype=np.int8)))
+        order = np.argsort(gaps, kind='stable')
+        return _fair_value_gap_zones(bars.highs, bars.lows, bars.labels, gaps[order] + 2, kinds[order], offset)
     
     def get_zones_near_price(self, zones: List[LiquidityZone], current_price: float, distance_pct: float = 0.5) -> List[LiquidityZone]:
-        nearby_zones = []
+        levels = np.fromiter((z.price_level for z in zones), dtype=np.float64, count=len(zones))
         
-        for zone in zones:
-            distance = abs(zone.price_level - current_price) / current_price
-            if distance <= distance_pct / 100:
-                nearby_zones.append(zone)
+        distance = np.abs(levels - current_price)
+        nearby = np.flatnonzero(distance / current_price <= distance_pct / 100)
         
-        nearby_zones.sort(key=lambda z: abs(z.price_level - current_price))
-        return nearby_zones
+        # Closest first; stable so equally distant zones keep their order
+        nearby = nearby[np.argsort(distance[nearby], kind='stable')]
+        return [zones[i] for i in nearby.tolist()]
     
     def get_strongest_zones(self, zones: List[LiquidityZone], count: int = 5) -> List[LiquidityZone]:
-        return sorted(zones, key=lambda z: z.strength, reverse=True)[:count]
+        # O(N log count); ties keep their original order like a stable sort
+        return heapq.nlargest(count, zones, key=attrgetter('strength'))
 
 
 def main():
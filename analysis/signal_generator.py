@@ -10,6 +10,7 @@ Combines all analysis components to generate final trading signals:
 Only generates signals when ALL conditions align.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass
@@ -17,7 +18,10 @@ import logging
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root, for running this module as a script; added only once
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core.enums import (
     CurrencyPair,
@@ -25,7 +29,8 @@ from core.enums import (
     FundamentalDirection,
     SignalStrength,
     SignalStatus,
-    TimeFrame
+    TimeFrame,
+    LiquidityZoneType
 )
 from core.exceptions import SignalGenerationError
 from core.config import config
@@ -42,7 +47,7 @@ from analysis.liquidity_zones import LiquidityZoneDetector, LiquidityZone
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """Complete trading signal with entry, SL, TP"""
     pair: CurrencyPair
@@ -114,6 +119,24 @@ class SignalGenerator:
     Only when ALL 5 conditions met → Generate signal
     """
     
+    _SUPPORT_ZONE_TYPES = frozenset({
+        LiquidityZoneType.EQUAL_LOWS,
+        LiquidityZoneType.STOP_HUNT_BUY,
+        LiquidityZoneType.FAIR_VALUE_GAP_BULLISH
+    })
+    _RESISTANCE_ZONE_TYPES = frozenset({
+        LiquidityZoneType.EQUAL_HIGHS,
+        LiquidityZoneType.STOP_HUNT_SELL,
+        LiquidityZoneType.FAIR_VALUE_GAP_BEARISH
+    })
+    # (trend, fundamental) direction pairs that count as aligned
+    _ALIGNED = frozenset({
+        (TrendDirection.BULLISH, FundamentalDirection.USD_WEAKER),
+        (TrendDirection.BULLISH, FundamentalDirection.COUNTERPARTY_STRONGER),
+        (TrendDirection.BEARISH, FundamentalDirection.USD_STRONGER),
+        (TrendDirection.BEARISH, FundamentalDirection.COUNTERPARTY_WEAKER)
+    })
+    
     def __init__(self):
         self.fundamental_analyzer = FundamentalAnalyzer()
         self.trend_detector = TrendDetector()
@@ -133,40 +156,70 @@ class SignalGenerator:
         Returns:
             Dictionary mapping pair name to TradingSignal
         """
-        logger.info(f"Generating signals for {len(pairs)} pairs...")
+        logger.info("Generating signals for %d pairs...", len(pairs))
+        
+        # One calendar fetch and analysis for the whole batch
+        try:
+            fundamental_signals = self.fundamental_analyzer.analyze_today(pairs)
+        except Exception as e:
+            logger.error("Fundamental analysis failed: %s", e)
+            return {}
         
         signals = {}
         
-        for pair in pairs:
-            try:
-                signal = self.generate_signal(pair)
-                
-                if signal:
-                    signals[pair.value] = signal
-                    logger.info(f"✅ Generated signal for {pair.value}: "
-                              f"{signal.direction} ({signal.strength.value})")
-                else:
-                    logger.info(f"No signal for {pair.value} - conditions not met")
+        # Each pair is analyzed once, even if listed more than once
+        unique_pairs = list(dict.fromkeys(pairs))
+        if not unique_pairs:
+            return signals
+        
+        # Pairs share no mutable state, so their (network-bound) market
+        # data fetches can overlap; results are collected in input order
+        with ThreadPoolExecutor(max_workers=min(len(unique_pairs), 8)) as executor:
+            futures = [
+                (pair, executor.submit(self.generate_signal, pair, fundamental_signals))
+                for pair in unique_pairs
+            ]
+            
+            for pair, future in futures:
+                try:
+                    signal = future.result()
                     
-            except Exception as e:
-                logger.error(f"Failed to generate signal for {pair.value}: {e}")
-                continue
-        
-        logger.info(f"Generated {len(signals)} signals out of {len(pairs)} pairs")
+                    if signal:
+                        signals[pair.value] = signal
+                        logger.info("✅ Generated signal for %s: %s (%s)",
+                                    pair.value, signal.direction, signal.strength.value)
+                    else:
+                        logger.info("No signal for %s - conditions not met", pair.value)
+                        
+                except Exception as e:
+                    logger.error("Failed to generate signal for %s: %s", pair.value, e)
+                    continue
+        
+        logger.info("Generated %d signals out of %d pairs", len(signals), len(pairs))
         return signals
     
-    def generate_signal(self, pair: CurrencyPair) -> Optional[TradingSignal]:
+    def generate_signal(
+        self,
+        pair: CurrencyPair,
+        fundamental_signals: Optional[Dict[str, FundamentalSignal]] = None
+    ) -> Optional[TradingSignal]:
         """
         Generate trading signal for a single pair
         
+        Args:
+            pair: Currency pair to analyze
+            fundamental_signals: Result of a batch analyze_today call
+                covering this pair; analyzed on demand when omitted
+        
         Returns:
             TradingSignal if all conditions met, None otherwise
         """
-        logger.info(f"Analyzing {pair.value} for signal generation...")
+        logger.info("Analyzing %s for signal generation...", pair.value)
         
         # Step 1: Fundamental Analysis
         logger.debug("Step 1: Fundamental analysis...")
-        fundamental_signals = self.fundamental_analyzer.analyze_today([pair])
+        if fundamental_signals is None:
+            fundamental_signals = self.fundamental_analyzer.analyze_today([pair])
         
         if pair.value not in fundamental_signals:
             logger.debug("❌ No fundamental signal")
@@ -174,7 +227,7 @@ class SignalGenerator:
         
         fundamental = fundamental_signals[pair.value]
         
-        if fundamental.strength.value < 2:
+        if fundamental.strength < SignalStrength.WEAK:
             logger.debug("❌ Fundamental signal too weak")
             return None
         
@@ -185,13 +238,14 @@ class SignalGenerator:
         trend_h1 = trends['H1']
         
         # Check H4 trend
-        if trend_h4.direction == TrendDirection.SIDEWAYS:
+        if trend_h4.direction is TrendDirection.SIDEWAYS:
             logger.debug("❌ H4 trend is sideways")
             return None
         
         # Check H1 confirmation
         if trend_h1.direction != trend_h4.direction:
-            logger.debug(f"❌ H1 ({trend_h1.direction.value}) doesn't confirm H4 ({trend_h4.direction.value})")
+            logger.debug("❌ H1 (%s) doesn't confirm H4 (%s)",
+                         trend_h1.direction.value, trend_h4.direction.value)
             return None
         
         # Step 3: Check fundamental-trend alignment
@@ -219,7 +273,7 @@ class SignalGenerator:
             return None
         
         # Determine direction
-        direction = 'long' if trend_h4.direction == TrendDirection.BULLISH else 'short'
+        direction = 'long' if trend_h4.direction is TrendDirection.BULLISH else 'short'
         
         # Find best entry zone
         entry_zone = self._find_best_entry_zone(nearby_zones, direction)
@@ -243,8 +297,8 @@ class SignalGenerator:
             entry_zone=entry_zone
         )
         
-        logger.info(f"✅ Signal generated: {pair.value} {direction.upper()} "
-                   f"(strength: {signal_strength.value})")
+        logger.info("✅ Signal generated: %s %s (strength: %s)",
+                    pair.value, direction.upper(), signal_strength.value)
         
         return signal
     
@@ -259,26 +313,7 @@ class SignalGenerator:
         Returns:
             True if aligned, False otherwise
         """
-        fund_dir = fundamental.direction
-        trend_dir = trend.direction
-        
-        # Bullish alignment
-        if trend_dir == TrendDirection.BULLISH:
-            if fund_dir in [
-                FundamentalDirection.USD_WEAKER,
-                FundamentalDirection.COUNTERPARTY_STRONGER
-            ]:
-                return True
-        
-        # Bearish alignment
-        elif trend_dir == TrendDirection.BEARISH:
-            if fund_dir in [
-                FundamentalDirection.USD_STRONGER,
-                FundamentalDirection.COUNTERPARTY_WEAKER
-            ]:
-                return True
-        
-        return False
+        return (trend.direction, fundamental.direction) in self._ALIGNED
     
     def _find_best_entry_zone(
         self,
@@ -294,18 +329,11 @@ class SignalGenerator:
         # For short: prefer zones above current price (resistance)
         
         # Filter by zone type
-        if direction == 'long':
-            # Look for support zones
-            support_zones = [z for z in zones if z.zone_type.value in [
-                'equal_lows', 'stop_hunt_buy', 'bullish_fvg'
-            ]]
-            return support_zones[0] if support_zones else zones[0]
-        else:
-            # Look for resistance zones
-            resistance_zones = [z for z in zones if z.zone_type.value in [
-                'equal_highs', 'stop_hunt_sell', 'bearish_fvg'
-            ]]
-            return resistance_zones[0] if resistance_zones else zones[0]
+        zone_types = self._SUPPORT_ZONE_TYPES if direction == 'long' else self._RESISTANCE_ZONE_TYPES
+        
+        # First match wins, so stop scanning as soon as one is found
+        match = next((z for z in zones if z.zone_type in zone_types), None)
+        return match if match is not None else zones[0]
     
     def _calculate_signal_strength(
         self,
@@ -317,11 +345,11 @@ class SignalGenerator:
         """Calculate overall signal strength"""
         
         # Start with fundamental strength
-        score = fundamental.strength.value
+        score = fundamental.strength
         
         # Add trend strength
-        score += trend_h4.strength.value
-        score += trend_h1.strength.value * 0.5  # H1 less weight
+        score += trend_h4.strength
+        score += trend_h1.strength * 0.5  # H1 less weight
         
         # Add liquidity zone bonus
         if zone_count >= 3:
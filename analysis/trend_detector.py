@@ -10,25 +10,32 @@ Detects market trends using:
 
 import pandas as pd
 import numpy as np
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 import logging
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root, for running this module as a script; added only once
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core.enums import CurrencyPair, TrendDirection, TimeFrame, SignalStrength
 from core.exceptions import TrendDetectionError, InsufficientDataError
 from core.config import config
 from data import MarketDataFetcher
+from analysis._numba_kernels import NUMBA_AVAILABLE, dual_ema
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrendAnalysis:
     """Results of trend analysis"""
     pair: CurrencyPair
@@ -78,6 +85,50 @@ class TrendAnalysis:
         return False
 
 
+def _span_alpha(span: int) -> float:
+    """Smoothing factor pandas derives from an EWM span"""
+    return 1.0 / (1.0 + (span - 1) / 2.0)
+
+
+# EMA smoothing factors, derived once from the configured spans
+_FAST_ALPHA = _span_alpha(config.EMA_FAST)
+_SLOW_ALPHA = _span_alpha(config.EMA_SLOW)
+
+# EMA separation (% of EMA200) worth 2 and 1 trend-strength points
+_SEPARATION_STRONG = 0.5
+_SEPARATION_MODERATE = 0.3
+
+
+def detect_swing_patterns_batch(
+    highs: np.ndarray,
+    lows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Higher/Lower Highs and Lows for many series at once
+    
+    Batched form of TrendDetector._detect_swing_patterns: row i holds the
+    latest bars of one series, oldest first, and its last bar is compared
+    with the range of the bars before the three most recent ones.
+    
+    Args:
+        highs: (n_series, lookback) array of high prices, lookback >= 4
+        lows: (n_series, lookback) array of low prices
+        
+    Returns:
+        Tuple of (higher_highs, higher_lows, lower_highs, lower_lows)
+        boolean arrays of shape (n_series,)
+    """
+    recent_high, previous_high = highs[:, -1], highs[:, :-3].max(axis=1)
+    recent_low, previous_low = lows[:, -1], lows[:, :-3].min(axis=1)
+    
+    return (
+        recent_high > previous_high,
+        recent_low > previous_low,
+        recent_high < previous_high,
+        recent_low < previous_low,
+    )
+
+
 class TrendDetector:
     """
     Multi-Timeframe Trend Detector
@@ -95,6 +146,9 @@ class TrendDetector:
     
     def __init__(self):
         self.fetcher = MarketDataFetcher()
+        self.analysis_cache_ttl = config.CACHE_TTL_SHORT
+        # Per-instance memo; exceptions are not cached, so failed analyses retry
+        self._analysis_memo = functools.lru_cache(maxsize=32)(self._analyze_for_bucket)
     
     def analyze_trend(
         self,
@@ -104,6 +158,10 @@ class TrendDetector:
         """
         Analyze trend for a pair on specific timeframe
         
+        Analyses are reused within a TTL bucket of `analysis_cache_ttl`
+        seconds, so regenerating signals intraday does not refetch and
+        recompute unchanged timeframes.
+        
         Args:
             pair: Currency pair
             timeframe: Timeframe to analyze
@@ -114,7 +172,17 @@ class TrendDetector:
         Raises:
             TrendDetectionError: If analysis fails
         """
-        logger.info(f"Analyzing trend for {pair.value} on {timeframe.value}")
+        return self._analysis_memo(pair, timeframe, self._cache_bucket())
+    
+    def _cache_bucket(self) -> int:
+        return int(time.time() // self.analysis_cache_ttl)
+    
+    def _analyze_for_bucket(self, pair: CurrencyPair, timeframe: TimeFrame, bucket: int) -> TrendAnalysis:
+        return self._analyze_trend(pair, timeframe)
+    
+    def _analyze_trend(self, pair: CurrencyPair, timeframe: TimeFrame) -> TrendAnalysis:
+        """Fetch data and run the full trend analysis, bypassing the memo"""
+        logger.info("Analyzing trend for %s on %s", pair.value, timeframe.value)
         
         try:
             # Fetch data
@@ -124,60 +192,135 @@ class TrendDetector:
             df = self._calculate_emas(df)
             
             # Detect patterns
-            higher_highs = self._detect_higher_highs(df)
-            higher_lows = self._detect_higher_lows(df)
-            lower_highs = self._detect_lower_highs(df)
-            lower_lows = self._detect_lower_lows(df)
+            patterns = self._detect_swing_patterns(df)
             
-            # Determine trend direction
-            direction = self._determine_trend(
-                df,
-                higher_highs,
-                higher_lows,
-                lower_highs,
-                lower_lows
-            )
-            
-            # Calculate strength
-            strength = self._calculate_trend_strength(
-                df,
-                direction,
-                higher_highs,
-                higher_lows,
-                lower_highs,
-                lower_lows
-            )
-            
-            # Get latest values
-            latest = df.iloc[-1]
-            
-            analysis = TrendAnalysis(
-                pair=pair,
-                timeframe=timeframe,
-                direction=direction,
-                strength=strength,
-                ema50=latest['ema50'],
-                ema200=latest['ema200'],
-                current_price=latest['close'],
-                higher_highs=higher_highs,
-                higher_lows=higher_lows,
-                lower_highs=lower_highs,
-                lower_lows=lower_lows,
-                analysis_time=datetime.now()
-            )
-            
-            logger.info(f"✅ Trend detected: {direction.value} (strength: {strength.value})")
-            
-            return analysis
+            return self._build_analysis(pair, timeframe, df, patterns)
             
         except Exception as e:
-            logger.error(f"Trend detection failed for {pair.value}: {e}")
+            logger.error("Trend detection failed for %s: %s", pair.value, e)
             raise TrendDetectionError(
                 pair=pair.value,
                 timeframe=timeframe.value,
                 reason=str(e)
             )
     
+    def _build_analysis(
+        self,
+        pair: CurrencyPair,
+        timeframe: TimeFrame,
+        df: pd.DataFrame,
+        patterns: Tuple[bool, bool, bool, bool]
+    ) -> TrendAnalysis:
+        """Turn a frame with EMAs and its swing patterns into a TrendAnalysis"""
+        higher_highs, higher_lows, lower_highs, lower_lows = patterns
+        
+        # Latest values, read once as scalars
+        ema50 = float(df['ema50'].to_numpy()[-1])
+        ema200 = float(df['ema200'].to_numpy()[-1])
+        current_price = float(df['close'].to_numpy()[-1])
+        
+        # Determine trend direction
+        direction = self._determine_trend(
+            ema50,
+            ema200,
+            higher_highs,
+            higher_lows,
+            lower_highs,
+            lower_lows
+        )
+        
+        # Calculate strength
+        strength = self._calculate_trend_strength(
+            ema50,
+            ema200,
+            direction,
+            higher_highs,
+            higher_lows,
+            lower_highs,
+            lower_lows
+        )
+        
+        analysis = TrendAnalysis(
+            pair=pair,
+            timeframe=timeframe,
+            direction=direction,
+            strength=strength,
+            ema50=ema50,
+            ema200=ema200,
+            current_price=current_price,
+            higher_highs=higher_highs,
+            higher_lows=higher_lows,
+            lower_highs=lower_highs,
+            lower_lows=lower_lows,
+            analysis_time=datetime.now()
+        )
+        
+        logger.info("✅ Trend detected: %s (strength: %s)", direction.value, strength.value)
+        
+        return analysis
+    
+    def analyze_batch(
+        self,
+        pairs: List[CurrencyPair],
+        timeframe: TimeFrame,
+        lookback: int = 10
+    ) -> Dict[str, TrendAnalysis]:
+        """
+        Analyze trend for several pairs on one timeframe
+        
+        Frames are fetched concurrently, then the swing patterns of all
+        pairs are detected together on a stacked (pairs x lookback) array
+        of their latest bars. Results bypass the analyze_trend memo.
+        
+        Args:
+            pairs: Currency pairs to analyze
+            timeframe: Timeframe shared by all pairs
+            lookback: Number of bars to check for swing patterns
+            
+        Returns:
+            Dictionary mapping pair name to its TrendAnalysis
+            
+        Raises:
+            TrendDetectionError: If analysis fails for any pair
+        """
+        if not pairs:
+            return {}
+        
+        # Capped like generate_signals: each pair makes its own market data request
+        with ThreadPoolExecutor(max_workers=min(len(pairs), 8)) as executor:
+            frames = list(executor.map(lambda pair: self._fetch_with_emas(pair, timeframe), pairs))
+        
+        patterns = {}
+        
+        # Frames shorter than the lookback take the per-pair path
+        stacked = [i for i, df in enumerate(frames) if len(df) >= lookback > 3]
+        if stacked:
+            flags = detect_swing_patterns_batch(
+                np.stack([frames[i]['high'].to_numpy()[-lookback:] for i in stacked]),
+                np.stack([frames[i]['low'].to_numpy()[-lookback:] for i in stacked])
+            )
+            patterns = dict(zip(stacked, zip(*(flag.tolist() for flag in flags))))
+        
+        analyses = {}
+        for i, (pair, df) in enumerate(zip(pairs, frames)):
+            try:
+                pair_patterns = patterns[i] if i in patterns else self._detect_swing_patterns(df, lookback)
+                analyses[pair.value] = self._build_analysis(pair, timeframe, df, pair_patterns)
+            except Exception as e:
+                logger.error("Trend detection failed for %s: %s", pair.value, e)
+                raise TrendDetectionError(pair=pair.value, timeframe=timeframe.value, reason=str(e))
+        
+        return analyses
+    
+    def _fetch_with_emas(self, pair: CurrencyPair, timeframe: TimeFrame) -> pd.DataFrame:
+        logger.info("Analyzing trend for %s on %s", pair.value, timeframe.value)
+        
+        try:
+            return self._calculate_emas(self.fetcher.fetch_data(pair, timeframe))
+        except Exception as e:
+            logger.error("Trend detection failed for %s: %s", pair.value, e)
+            raise TrendDetectionError(pair=pair.value, timeframe=timeframe.value, reason=str(e))
+    
     def analyze_multi_timeframe(
         self,
         pair: CurrencyPair
@@ -185,13 +328,19 @@ class TrendDetector:
         """
         Analyze trend on both H4 and H1 timeframes
         
+        The two timeframes are fetched and analyzed concurrently, so the
+        call waits for the slower fetch rather than for both in turn.
+        
         Returns:
             Dictionary with 'H4' and 'H1' trend analyses
         """
-        logger.info(f"Multi-timeframe analysis for {pair.value}")
+        logger.info("Multi-timeframe analysis for %s", pair.value)
         
-        h4_trend = self.analyze_trend(pair, TimeFrame.H4)
-        h1_trend = self.analyze_trend(pair, TimeFrame.H1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            h4_future = executor.submit(self.analyze_trend, pair, TimeFrame.H4)
+            h1_future = executor.submit(self.analyze_trend, pair, TimeFrame.H1)
+            h4_trend = h4_future.result()
+            h1_trend = h1_future.result()
         
         return {
             'H4': h4_trend,
@@ -200,72 +349,51 @@ class TrendDetector:
     
     def _calculate_emas(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate EMA50 and EMA200"""
+        if NUMBA_AVAILABLE and len(df):
+            # Both EMAs in one compiled pass, with pandas' span -> alpha
+            close = df['close'].to_numpy(dtype=np.float64)
+            df['ema50'], df['ema200'] = dual_ema(close, _FAST_ALPHA, _SLOW_ALPHA)
+            return df
+        
         df['ema50'] = df['close'].ewm(span=config.EMA_FAST, adjust=False).mean()
         df['ema200'] = df['close'].ewm(span=config.EMA_SLOW, adjust=False).mean()
         return df
     
-    def _detect_higher_highs(self, df: pd.DataFrame, lookback: int = 10) -> bool:
+    def _detect_swing_patterns(self, df: pd.DataFrame, lookback: int = 10) -> Tuple[bool, bool, bool, bool]:
         """
-        Detect Higher Highs pattern
+        Detect Higher/Lower Highs and Lows in one pass over the tail
+        
+        The latest high and low are compared with the range of the bars
+        before the three most recent ones.
         
         Args:
             df: DataFrame with OHLCV data
             lookback: Number of bars to check
             
         Returns:
-            True if Higher Highs detected
+            Tuple of (higher_highs, higher_lows, lower_highs, lower_lows)
         """
-        highs = df['high'].tail(lookback).values
+        highs = df['high'].to_numpy()[-lookback:]
+        lows = df['low'].to_numpy()[-lookback:]
         
-        # Need at least 3 highs to confirm pattern
+        # Need at least 3 bars to confirm a pattern
         if len(highs) < 3:
-            return False
+            return False, False, False, False
         
-        # Check if recent highs are generally increasing
-        recent_high = highs[-1]
-        previous_high = max(highs[:-3])
+        recent_high, previous_high = highs[-1], highs[:-3].max()
+        recent_low, previous_low = lows[-1], lows[:-3].min()
         
-        return recent_high > previous_high
-    
-    def _detect_higher_lows(self, df: pd.DataFrame, lookback: int = 10) -> bool:
-        """Detect Higher Lows pattern"""
-        lows = df['low'].tail(lookback).values
-        
-        if len(lows) < 3:
-            return False
-        
-        recent_low = lows[-1]
-        previous_low = min(lows[:-3])
-        
-        return recent_low > previous_low
-    
-    def _detect_lower_highs(self, df: pd.DataFrame, lookback: int = 10) -> bool:
-        """Detect Lower Highs pattern"""
-        highs = df['high'].tail(lookback).values
-        
-        if len(highs) < 3:
-            return False
-        
-        recent_high = highs[-1]
-        previous_high = max(highs[:-3])
-        
-        return recent_high < previous_high
-    
-    def _detect_lower_lows(self, df: pd.DataFrame, lookback: int = 10) -> bool:
-        """Detect Lower Lows pattern"""
-        lows = df['low'].tail(lookback).values
-        
-        if len(lows) < 3:
-            return False
-        
-        recent_low = lows[-1]
-        previous_low = min(lows[:-3])
-        
-        return recent_low < previous_low
+        return (
+            bool(recent_high > previous_high),
+            bool(recent_low > previous_low),
+            bool(recent_high < previous_high),
+            bool(recent_low < previous_low),
+        )
     
     def _determine_trend(
         self,
-        df: pd.DataFrame,
+        ema50: float,
+        ema200: float,
         higher_highs: bool,
         higher_lows: bool,
         lower_highs: bool,
@@ -273,10 +401,6 @@ class TrendDetector:
     ) -> TrendDirection:
         """Determine overall trend direction"""
         
-        latest = df.iloc[-1]
-        ema50 = latest['ema50']
-        ema200 = latest['ema200']
-        
         # Primary: EMA crossover
         if ema50 > ema200:
             # Potential bullish trend
@@ -301,7 +425,8 @@ class TrendDetector:
     
     def _calculate_trend_strength(
         self,
-        df: pd.DataFrame,
+        ema50: float,
+        ema200: float,
         direction: TrendDirection,
         higher_highs: bool,
         higher_lows: bool,
@@ -310,13 +435,9 @@ class TrendDetector:
     ) -> SignalStrength:
         """Calculate trend strength based on multiple factors"""
         
-        if direction == TrendDirection.SIDEWAYS:
+        if direction is TrendDirection.SIDEWAYS:
             return SignalStrength.NO_SIGNAL
         
-        latest = df.iloc[-1]
-        ema50 = latest['ema50']
-        ema200 = latest['ema200']
-        
         # Calculate EMA separation (as percentage)
         ema_separation = abs(ema50 - ema200) / ema200 * 100
         
@@ -324,18 +445,18 @@ class TrendDetector:
         score = 0
         
         # EMA separation
-        if ema_separation > 0.5:
+        if ema_separation > _SEPARATION_STRONG:
             score += 2
-        elif ema_separation > 0.3:
+        elif ema_separation > _SEPARATION_MODERATE:
             score += 1
         
         # Pattern confirmation
-        if direction == TrendDirection.BULLISH:
+        if direction is TrendDirection.BULLISH:
             if higher_highs and higher_lows:
                 score += 3
             elif higher_highs or higher_lows:
                 score += 1
-        elif direction == TrendDirection.BEARISH:
+        elif direction is TrendDirection.BEARISH:
             if lower_highs and lower_lows:
                 score += 3
             elif lower_highs or lower_lows:
@@ -5,17 +5,107 @@ Loads and validates all configuration from environment variables (.env file).
 Provides centralized access to all system settings with type safety and validation.
 """
 
+import json
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
 from datetime import datetime
 import logging
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+from dotenv.main import resolve_variables
 
 
 logger = logging.getLogger(__name__)
 
+# Parsed copy of .env, reused while the file is unchanged
+_ENV_CACHE_NAME = ".env.cache.json"
+
+
+def _load_env_file(env_path: Path) -> None:
+    """
+    Load a .env file into os.environ, like load_dotenv
+    
+    Parsing .env is the slowest part of startup, so the raw, uninterpolated
+    values are cached as JSON next to it, keyed by the file's mtime and
+    size. ${VAR} references are resolved against the current environment
+    on every load, and variables already set in the environment are never
+    overridden.
+    
+    Args:
+        env_path: Path to the .env file
+    """
+    stat = env_path.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache_path = env_path.with_name(_ENV_CACHE_NAME)
+    
+    raw = None
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['stamp'] == stamp:
+            raw = cached['raw']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    if raw is None:
+        raw = dotenv_values(env_path, interpolate=False)
+        try:
+            # Same secrets as .env, so keep the cache private to the owner
+            tmp_path = cache_path.with_name(_ENV_CACHE_NAME + '.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'stamp': stamp, 'raw': raw}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write %s: %s", cache_path, e)
+    
+    # Same resolution as load_dotenv(override=False): environment first
+    for key, value in resolve_variables(raw.items(), override=False).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+
+class PairSpec(NamedTuple):
+    """Pip size and lot specifications for a currency pair"""
+    pip_value: float     # Pip size
+    pip_decimals: int    # Decimal places of a quote
+    lot_size: int        # Units in a standard lot
+    min_lot: float       # Minimum lot size
+    max_lot: float       # Maximum lot size
+    spread_avg: float    # Average spread in pips
+
+
+# Pip values and specifications for each currency pair, shared read-only
+PAIR_CONFIG = MappingProxyType({
+    'GBP/USD': PairSpec(
+        pip_value=0.0001,      # Standard pip size
+        pip_decimals=5,        # Decimal places (1.26543)
+        lot_size=100000,       # Standard lot = 100,000 units
+        min_lot=0.01,
+        max_lot=100.0,
+        spread_avg=1.5,
+    ),
+    'EUR/USD': PairSpec(
+        pip_value=0.0001,
+        pip_decimals=5,
+        lot_size=100000,
+        min_lot=0.01,
+        max_lot=100.0,
+        spread_avg=1.2,
+    ),
+    'USD/JPY': PairSpec(
+        pip_value=0.01,        # JPY pairs use 0.01
+        pip_decimals=3,        # Decimal places (149.543)
+        lot_size=100000,
+        min_lot=0.01,
+        max_lot=100.0,
+        spread_avg=1.8,
+    ),
+})
+
 
 class Config:
     """
@@ -27,17 +117,16 @@ class Config:
     """
     
     VERSION = "2.0.0"
+    PAIR_CONFIG = PAIR_CONFIG
     
     def __init__(self):
         """Initialize configuration from environment variables"""
         
         # Load .env file
         env_path = Path(__file__).parent.parent / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
-            logger.info(f"✅ Loaded configuration from {env_path}")
-        else:
-            logger.warning(f"⚠️  .env file not found at {env_path}")
+        env_found = env_path.exists()
+        if env_found:
+            _load_env_file(env_path)
         
         # =================================================================
         # TRADING CONFIGURATION
@@ -76,38 +165,6 @@ class Config:
         self.ALERT_LEVEL_ENTRY_CONFIRM = self._get_bool('ALERT_LEVEL_ENTRY_CONFIRM', True)
         self.ALERT_LEVEL_ERROR = self._get_bool('ALERT_LEVEL_ERROR', True)
         
-        # =================================================================
-        # PAIR-SPECIFIC CONFIGURATION
-        # =================================================================
-        
-        # Pip values and specifications for each currency pair
-        self.PAIR_CONFIG = {
-            'GBP/USD': {
-                'pip_value': 0.0001,      # Standard pip size
-                'pip_decimals': 5,         # Decimal places (1.26543)
-                'lot_size': 100000,        # Standard lot = 100,000 units
-                'min_lot': 0.01,           # Minimum lot size
-                'max_lot': 100.0,          # Maximum lot size
-                'spread_avg': 1.5,         # Average spread in pips
-            },
-            'EUR/USD': {
-                'pip_value': 0.0001,
-                'pip_decimals': 5,
-                'lot_size': 100000,
-                'min_lot': 0.01,
-                'max_lot': 100.0,
-                'spread_avg': 1.2,
-            },
-            'USD/JPY': {
-                'pip_value': 0.01,         # JPY pairs use 0.01
-                'pip_decimals': 3,         # Decimal places (149.543)
-                'lot_size': 100000,
-                'min_lot': 0.01,
-                'max_lot': 100.0,
-                'spread_avg': 1.8,
-            },
-        }
-        
         # =================================================================
         # TECHNICAL ANALYSIS SETTINGS
         # =================================================================
@@ -158,10 +215,6 @@ class Config:
         self.LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', '10485760'))
         self.LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
         
-        # Create logs directory if it doesn't exist
-        log_dir = Path(self.LOG_FILE).parent
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
         # =================================================================
         # SYSTEM SETTINGS
         # =================================================================
@@ -173,12 +226,18 @@ class Config:
         self.BACKTEST_START_DATE = os.getenv('BACKTEST_START_DATE', '2024-01-01')
         self.BACKTEST_END_DATE = os.getenv('BACKTEST_END_DATE', '2024-12-31')
         
-        logger.info("✅ Configuration loaded successfully")
+        # One startup record instead of one per step
+        if env_found:
+            logger.info("✅ Configuration loaded from %s", env_path)
+        else:
+            logger.warning("⚠️  .env file not found at %s", env_path)
     
     def _get_bool(self, key: str, default: bool = False) -> bool:
         """Get boolean value from environment"""
-        value = os.getenv(key, str(default)).lower()
-        return value in ('true', '1', 'yes', 'on')
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value.lower() in ('true', '1', 'yes', 'on')
     
     def get_trading_pairs(self) -> List:
         """
@@ -187,6 +246,11 @@ class Config:
         Returns:
             List of CurrencyPair enum values
         """
+        return list(self._trading_pairs)
+    
+    @cached_property
+    def _trading_pairs(self) -> Tuple:
+        """TRADING_PAIRS parsed once into CurrencyPair enums"""
         from core.enums import CurrencyPair
         
         pairs = []
@@ -198,7 +262,7 @@ class Config:
             except ValueError:
                 logger.warning(f"Invalid currency pair in config: {pair_str}")
         
-        return pairs
+        return tuple(pairs)
     
     def get_alert_levels(self) -> List:
         """
@@ -207,6 +271,11 @@ class Config:
         Returns:
             List of enabled AlertLevel enums
         """
+        return list(self._alert_levels)
+    
+    @cached_property
+    def _alert_levels(self) -> Tuple:
+        """Enabled alert levels, collected once"""
         from core.enums import AlertLevel
         
         levels = []
@@ -221,7 +290,7 @@ class Config:
         if self.ALERT_LEVEL_ERROR:
             levels.append(AlertLevel.ERROR)
         
-        return levels
+        return tuple(levels)
     
     def validate_telegram(self) -> bool:
         """Validate Telegram configuration"""
@@ -5,7 +5,9 @@ Contains all enum types used throughout the trading system
 for type safety and clarity.
 """
 
-from enum import Enum, auto
+from datetime import time
+from enum import Enum, IntEnum, auto
+from types import MappingProxyType
 
 
 class TrendDirection(Enum):
@@ -16,8 +18,8 @@ class TrendDirection(Enum):
     UNDEFINED = "undefined"
 
 
-class SignalStrength(Enum):
-    """Strength of trading signal"""
+class SignalStrength(IntEnum):
+    """Strength of trading signal, ordered so levels compare as ints"""
     VERY_STRONG = 5
     STRONG = 4
     MODERATE = 3
@@ -96,20 +98,12 @@ class CurrencyPair(Enum):
     EUR_USD = "EUR/USD"
     USD_JPY = "USD/JPY"
     
-    @property
-    def base_currency(self) -> str:
-        """Get base currency (first in pair)"""
-        return self.value.split("/")[0]
-    
-    @property
-    def quote_currency(self) -> str:
-        """Get quote currency (second in pair)"""
-        return self.value.split("/")[1]
-    
-    @property
-    def yfinance_ticker(self) -> str:
-        """Convert to yfinance ticker format"""
-        return self.value.replace("/", "") + "=X"
+    def __init__(self, value: str):
+        # Derived once per member instead of re-splitting on every access
+        base, quote = value.split("/")
+        self.base_currency = base  # First currency in the pair
+        self.quote_currency = quote  # Second currency in the pair
+        self.yfinance_ticker = base + quote + "=X"  # yfinance ticker format
 
 class FundamentalDirection(Enum):
     """Fundamental analysis direction"""
@@ -138,8 +132,8 @@ class RiskLevel(Enum):
     VERY_AGGRESSIVE = 3.0
 
 
-# Mapping news events to impact levels
-NEWS_EVENT_IMPACT = {
+# Mapping news events to impact levels (read-only, shared)
+NEWS_EVENT_IMPACT = MappingProxyType({
     # US Events
     "NFP": NewsImpact.HIGH,
     "CPI": NewsImpact.HIGH,
@@ -167,13 +161,19 @@ NEWS_EVENT_IMPACT = {
     "JP_CPI": NewsImpact.HIGH,
     "JP_TANKAN": NewsImpact.HIGH,
     "JP_GDP": NewsImpact.MEDIUM,
-}
-
-
-# Market open times (UTC)
-MARKET_OPEN_TIMES = {
-    MarketSession.TOKYO: "00:00",
-    MarketSession.LONDON: "08:00",
-    MarketSession.NEW_YORK: "13:30",
-    MarketSession.SYDNEY: "22:00",
-}
+})
+
+
+# Market open times (UTC), parsed once
+MARKET_OPEN_TIMES = MappingProxyType({
+    MarketSession.TOKYO: time(0, 0),
+    MarketSession.LONDON: time(8, 0),
+    MarketSession.NEW_YORK: time(13, 30),
+    MarketSession.SYDNEY: time(22, 0),
+})
+
+# Market open times as minutes after midnight UTC, for integer comparisons
+SESSION_MINUTES = MappingProxyType({
+    session: open_time.hour * 60 + open_time.minute
+    for session, open_time in MARKET_OPEN_TIMES.items()
+})
@@ -42,9 +42,8 @@ LOGO = r"""
 def setup_logging():
     """Configure logging for the application"""
     
-    # Ensure logs directory exists
-    log_dir = PROJECT_ROOT / "logs"
-    log_dir.mkdir(exist_ok=True)
+    # Ensure the log file's directory exists, only once logging is set up
+    Path(config.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
     
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
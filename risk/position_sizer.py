@@ -141,7 +141,7 @@ class PositionSizer:
                         f"({self.risk_percentage}% of ${self.account_balance:,.2f})")
             
             # Get pip value for this pair
-            pip_size = config.PAIR_CONFIG[pair.value]['pip_value']
+            pip_size = config.PAIR_CONFIG[pair.value].pip_value
             
             # Calculate stop distance in pips
             stop_distance = abs(entry_price - stop_loss)
@@ -122,7 +122,7 @@ class SLTPCalculator:
             self._validate_stop_loss(direction, entry_price, stop_loss)
             
             # Calculate pip size and stop distance
-            pip_size = config.PAIR_CONFIG[pair.value]['pip_value']
+            pip_size = config.PAIR_CONFIG[pair.value].pip_value
             stop_distance = abs(entry_price - stop_loss)
             stop_distance_pips = stop_distance / pip_size
             
@@ -184,7 +184,7 @@ class SLTPCalculator:
         - For shorts: Place SL above nearest resistance zone
         - If no zones: Use 1.5% default
         """
-        pip_size = config.PAIR_CONFIG[pair.value]['pip_value']
+        pip_size = config.PAIR_CONFIG[pair.value].pip_value
         
         if liquidity_zones:
             # Find nearest zone in opposite direction
@@ -295,7 +295,7 @@ class SLTPCalculator:
         Returns:
             (profit_at_tp1, profit_at_tp2, profit_at_tp3)
         """
-        pip_size = config.PAIR_CONFIG[levels.pair.value]['pip_value']
+        pip_size = config.PAIR_CONFIG[levels.pair.value].pip_value
         
         # Calculate pip distance to each TP
         tp1_pips = abs(levels.take_profit_1 - levels.entry_price) / pip_size
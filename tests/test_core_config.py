@@ -0,0 +1,54 @@
+"""Tests for core.config"""
+
+import json
+import os
+
+from core.config import _ENV_CACHE_NAME, _load_env_file
+
+
+def test_env_file_is_cached_until_it_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'environ', {})
+    env_path = tmp_path / '.env'
+    env_path.write_text('RISK_PERCENTAGE=1.5\nTELEGRAM_CHAT_ID="abc def"\n')
+
+    _load_env_file(env_path)
+
+    expected = {'RISK_PERCENTAGE': '1.5', 'TELEGRAM_CHAT_ID': 'abc def'}
+    assert os.environ == expected
+    assert json.loads((tmp_path / _ENV_CACHE_NAME).read_text())['raw'] == expected
+
+    # A different size invalidates the cache
+    env_path.write_text('RISK_PERCENTAGE=2.25\n')
+    os.environ.clear()
+    _load_env_file(env_path)
+
+    assert os.environ == {'RISK_PERCENTAGE': '2.25'}
+
+
+def test_env_file_does_not_override_environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'environ', {'RISK_PERCENTAGE': '3.0'})
+    env_path = tmp_path / '.env'
+    env_path.write_text('RISK_PERCENTAGE=1.5\n')
+
+    _load_env_file(env_path)
+    _load_env_file(env_path)
+
+    assert os.environ == {'RISK_PERCENTAGE': '3.0'}
+
+
+def test_env_file_references_follow_the_environment(tmp_path, monkeypatch):
+    env_path = tmp_path / '.env'
+    env_path.write_text('LOG_DIR=/srv/default\nLOG_FILE=${LOG_DIR}/bot.log\n')
+
+    monkeypatch.setattr(os, 'environ', {'LOG_DIR': '/srv/a'})
+    _load_env_file(env_path)
+    assert os.environ['LOG_FILE'] == '/srv/a/bot.log'
+
+    # Second load comes from the cache but resolves against the new value
+    monkeypatch.setattr(os, 'environ', {'LOG_DIR': '/srv/b'})
+    _load_env_file(env_path)
+    assert os.environ['LOG_FILE'] == '/srv/b/bot.log'
+
+    monkeypatch.setattr(os, 'environ', {})
+    _load_env_file(env_path)
+    assert os.environ == {'LOG_DIR': '/srv/default', 'LOG_FILE': '/srv/default/bot.log'}
@@ -0,0 +1,113 @@
+"""Tests for analysis.fundamental"""
+
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+import analysis.fundamental as fundamental
+from analysis.fundamental import FundamentalAnalyzer
+from core.enums import CurrencyPair, NewsImpact, SignalStrength
+from data import EconomicEvent
+
+
+@pytest.fixture
+def analyzer():
+    return FundamentalAnalyzer()
+
+
+@pytest.mark.parametrize("value_str, expected", [
+    ("1.5K", 1500.0),
+    ("250K", 250000.0),
+    ("2.1M", 2100000.0),
+    ("1B", 1000000000.0),
+    ("3.2%", 3.2),
+    ("-0.4%", -0.4),
+    ("1,250", 1250.0),
+])
+def test_parse_economic_value(analyzer, value_str, expected):
+    assert analyzer._parse_economic_value(value_str) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("value_str", [None, "", "   ", "n/a"])
+def test_parse_economic_value_invalid(analyzer, value_str):
+    assert analyzer._parse_economic_value(value_str) is None
+
+
+@pytest.mark.parametrize("score_diff, expected", [
+    (0.5, SignalStrength.VERY_WEAK),
+    (1.5, SignalStrength.WEAK),
+    (3.0, SignalStrength.MODERATE),
+    (4.9, SignalStrength.MODERATE),
+    (5.0, SignalStrength.STRONG),
+    (8.0, SignalStrength.VERY_STRONG),
+])
+def test_calculate_strength_thresholds(analyzer, score_diff, expected):
+    # Three events -> multiplier of 1.0, so thresholds apply to score_diff directly
+    assert analyzer._calculate_strength(score_diff, 3) == expected
+
+
+class RecordingAPI:
+    """Stand-in calendar that records each fetch"""
+
+    def __init__(self, news=None):
+        self.news = news or {}
+        self.calls = 0
+
+    def get_relevant_news(self, pairs, high_impact_only=True):
+        self.calls += 1
+        return {p.value: self.news.get(p.value, []) for p in pairs}
+
+
+class FixedDate(date):
+    current = date(2024, 3, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+def test_news_cache_drops_expired_and_past_days(analyzer, monkeypatch):
+    monkeypatch.setattr(fundamental, 'date', FixedDate)
+    monkeypatch.setattr(FixedDate, 'current', date(2024, 3, 1))
+    analyzer.api = RecordingAPI()
+
+    analyzer._get_news([CurrencyPair.EUR_USD])
+    analyzer._get_news([CurrencyPair.EUR_USD])
+    analyzer._get_news([CurrencyPair.GBP_USD])
+    assert analyzer.api.calls == 2
+    assert len(analyzer._news_cache) == 2
+
+    # Next day: only the new day's entry is kept
+    monkeypatch.setattr(FixedDate, 'current', date(2024, 3, 2))
+    analyzer._get_news([CurrencyPair.EUR_USD])
+    assert analyzer.api.calls == 3
+    assert [key[2] for key in analyzer._news_cache] == ['2024-03-02']
+
+    # Expired entries are dropped when a new one is stored
+    analyzer.news_cache_ttl = 0
+    analyzer._get_news([CurrencyPair.GBP_USD])
+    assert len(analyzer._news_cache) == 1
+
+
+def test_analyze_today_async_matches_sync(analyzer, monkeypatch):
+    monkeypatch.setattr(fundamental, 'date', FixedDate)
+    monkeypatch.setattr(FixedDate, 'current', date(2024, 3, 1))
+    when = datetime(2024, 3, 1, 12, 30)
+    analyzer.api = RecordingAPI({'EUR/USD': [
+        EconomicEvent(when, '12:30', 'USD', NewsImpact.HIGH, 'Retail Sales m/m', actual='1.0%', forecast='0.2%'),
+        EconomicEvent(when, '10:00', 'EUR', NewsImpact.HIGH, 'GDP q/q', actual='-0.5%', forecast='0.3%'),
+    ]})
+    pairs = [CurrencyPair.EUR_USD, CurrencyPair.GBP_USD]
+
+    async_signals = asyncio.run(analyzer.analyze_today_async(pairs))
+    signals = analyzer.analyze_today(pairs)
+
+    assert list(async_signals) == list(signals) == ['EUR/USD']
+    assert [
+        (s.pair, s.direction, s.strength, s.events, s.expected_impact) for s in async_signals.values()
+    ] == [
+        (s.pair, s.direction, s.strength, s.events, s.expected_impact) for s in signals.values()
+    ]
+    # The sync call reuses the calendar fetched by the async one
+    assert analyzer.api.calls == 1
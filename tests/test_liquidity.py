@@ -0,0 +1,166 @@
+"""Tests for analysis.liquidity_zones"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.liquidity_zones import LiquidityZone, LiquidityZoneDetector, zones_to_dicts
+from core.enums import CurrencyPair, LiquidityZoneType, TimeFrame
+
+
+def make_ohlc(rows):
+    """Build an OHLC DataFrame from (open, high, low, close) tuples"""
+    index = pd.date_range('2024-01-01', periods=len(rows), freq='15min', tz='UTC')
+    return pd.DataFrame(rows, columns=['open', 'high', 'low', 'close'], index=index)
+
+
+@pytest.fixture
+def detector():
+    return LiquidityZoneDetector()
+
+
+def test_fair_value_gaps(detector):
+    df = make_ohlc([
+        (1.1000, 1.1010, 1.0990, 1.1005),
+        (1.1005, 1.1100, 1.1000, 1.1095),   # impulse up
+        (1.1095, 1.1120, 1.1050, 1.1110),   # low above candle 1 high -> bullish FVG
+        (1.1110, 1.1115, 1.1060, 1.1070),
+        (1.1000, 1.1020, 1.0900, 1.0910),   # high below candle 3 low -> bearish FVG
+    ])
+
+    zones = detector._detect_fair_value_gaps(df)
+
+    assert [z.zone_type for z in zones] == [
+        LiquidityZoneType.FAIR_VALUE_GAP_BULLISH,
+        LiquidityZoneType.FAIR_VALUE_GAP_BEARISH,
+    ]
+    bullish, bearish = zones
+    assert bullish.candle_index == 2
+    assert bullish.price_range == pytest.approx((1.1010, 1.1050))
+    assert bullish.time_detected == df.index[2]
+    assert bearish.candle_index == 4
+    assert bearish.price_range == pytest.approx((1.1020, 1.1050))
+
+
+def test_fair_value_gaps_short_frame(detector):
+    assert detector._detect_fair_value_gaps(make_ohlc([(1.1, 1.2, 1.0, 1.1)])) == []
+
+
+class CountingFetcher:
+    """Stand-in fetcher that records how often it is called"""
+
+    def __init__(self, df):
+        self.df = df
+        self.calls = 0
+
+    def fetch_data(self, pair, timeframe):
+        self.calls += 1
+        return self.df
+
+
+def test_cached_fetch_reuses_bucket(detector):
+    fetcher = CountingFetcher(make_ohlc([(1.1, 1.2, 1.0, 1.1)]))
+    detector.fetcher = fetcher
+
+    detector._cached_fetch(CurrencyPair.EUR_USD, TimeFrame.H1, 7)
+    detector._cached_fetch(CurrencyPair.EUR_USD, TimeFrame.H1, 7)
+    assert fetcher.calls == 1
+
+    detector._cached_fetch(CurrencyPair.EUR_USD, TimeFrame.H1, 8)
+    detector._cached_fetch(CurrencyPair.EUR_USD, TimeFrame.H1, None)
+    assert fetcher.calls == 3
+
+
+def test_detect_all_zones_batch(detector):
+    df = make_ohlc([(1.1, 1.2, 1.0, 1.1)] * 30)
+    detector.fetcher = CountingFetcher(df)
+
+    results = detector.detect_all_zones_batch([CurrencyPair.EUR_USD, CurrencyPair.GBP_USD], TimeFrame.H1)
+
+    assert list(results) == ['EUR/USD', 'GBP/USD']
+    assert detector.fetcher.calls == 2
+
+
+def test_detect_batch_covers_every_timeframe(detector):
+    df = make_ohlc([(1.1, 1.2, 1.0, 1.1)] * 30)
+    detector.fetcher = CountingFetcher(df)
+
+    results = detector.detect_batch([CurrencyPair.EUR_USD, CurrencyPair.GBP_USD], [TimeFrame.M15, TimeFrame.H1])
+
+    assert list(results) == [('EUR/USD', '15m'), ('EUR/USD', '1h'), ('GBP/USD', '15m'), ('GBP/USD', '1h')]
+    assert detector.fetcher.calls == 4
+
+
+def make_zone(level, strength=3):
+    return LiquidityZone(
+        zone_type=LiquidityZoneType.EQUAL_HIGHS,
+        price_level=level,
+        price_range=(level, level),
+        strength=strength,
+        touches=2,
+        time_detected=pd.Timestamp('2024-01-01', tz='UTC'),
+        candle_index=0
+    )
+
+
+def test_zones_near_price_closest_first(detector):
+    zones = [make_zone(1.1050), make_zone(1.0980), make_zone(1.2000), make_zone(1.1010)]
+
+    nearby = detector.get_zones_near_price(zones, 1.1000, distance_pct=0.5)
+
+    assert [z.price_level for z in nearby] == [1.1010, 1.0980, 1.1050]
+
+
+def test_zones_near_price_after_in_place_sort(detector):
+    rng = np.random.default_rng(1)
+    close = 1.25 + np.cumsum(rng.normal(0, 0.0008, 300))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.0005, (2, 300)))
+    detector.fetcher = CountingFetcher(make_ohlc(list(zip(open_, np.maximum(open_, close) + spread[0], np.minimum(open_, close) - spread[1], close))))
+
+    zones = detector.detect_all_zones(CurrencyPair.EUR_USD, TimeFrame.M15)
+    detected = list(zones)
+    zones.sort(key=lambda z: z.price_level)
+    price = float(np.median([z.price_level for z in zones]))
+
+    nearby = detector.get_zones_near_price(zones, price, distance_pct=0.3)
+
+    assert nearby == detector.get_zones_near_price(list(zones), price, distance_pct=0.3)
+    assert all(abs(z.price_level - price) / price * 100 <= 0.3 for z in nearby)
+    # The reordering does not leak into the detector's reused result
+    assert detector.detect_all_zones(CurrencyPair.EUR_USD, TimeFrame.M15) == detected
+
+
+def test_incremental_scan_matches_full_scan():
+    rng = np.random.default_rng(0)
+    close = 1.25 + np.cumsum(rng.normal(0, 0.0008, 300))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.0005, (2, 300)))
+    full = make_ohlc(list(zip(open_, np.maximum(open_, close) + spread[0], np.minimum(open_, close) - spread[1], close)))
+
+    incremental = LiquidityZoneDetector()
+    incremental.fetcher = CountingFetcher(full.iloc[:250])
+    incremental._cached_fetch = lambda pair, timeframe, bucket: incremental.fetcher.df
+    incremental.detect_all_zones(CurrencyPair.EUR_USD, TimeFrame.M15)
+
+    incremental.fetcher.df = full
+    zones = incremental.detect_all_zones(CurrencyPair.EUR_USD, TimeFrame.M15)
+
+    fresh = LiquidityZoneDetector()
+    fresh.fetcher = CountingFetcher(full)
+    expected = fresh.detect_all_zones(CurrencyPair.EUR_USD, TimeFrame.M15)
+
+    assert [(z.zone_type, z.candle_index) for z in zones] == [(z.zone_type, z.candle_index) for z in expected]
+
+
+def test_zones_to_dicts_matches_to_dict(detector):
+    rng = np.random.default_rng(1)
+    close = 1.25 + np.round(np.cumsum(rng.normal(0, 0.0008, 300)), 5)
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.round(np.abs(rng.normal(0, 0.0005, (2, 300))), 5)
+    detector.fetcher = CountingFetcher(make_ohlc(list(zip(open_, np.maximum(open_, close) + spread[0], np.minimum(open_, close) - spread[1], close))))
+    zones = detector.detect_all_zones(CurrencyPair.EUR_USD, TimeFrame.M15)
+
+    assert zones
+    assert zones_to_dicts(zones) == [zone.to_dict() for zone in zones]
+    assert zones_to_dicts([]) == []
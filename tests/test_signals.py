@@ -0,0 +1,75 @@
+"""Tests for analysis.signal_generator"""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from analysis.liquidity_zones import LiquidityZone
+from analysis.signal_generator import SignalGenerator
+from core.enums import CurrencyPair, LiquidityZoneType, SignalStrength
+
+
+class RecordingAnalyzer:
+    """Stand-in fundamental analyzer that records the pairs it is asked about"""
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze_today(self, pairs):
+        self.calls.append(list(pairs))
+        return {}
+
+
+@pytest.fixture
+def generator():
+    return SignalGenerator()
+
+
+def test_generate_signals_analyzes_fundamentals_once(generator):
+    generator.fundamental_analyzer = RecordingAnalyzer()
+    pairs = [CurrencyPair.EUR_USD, CurrencyPair.GBP_USD, CurrencyPair.EUR_USD]
+
+    signals = generator.generate_signals(pairs)
+
+    assert signals == {}
+    assert generator.fundamental_analyzer.calls == [pairs]
+
+
+def test_generate_signals_skips_failed_pairs(generator):
+    def fake_signal(pair, fundamental_signals=None):
+        if pair == CurrencyPair.GBP_USD:
+            raise RuntimeError('fetch failed')
+        return SimpleNamespace(direction='long', strength=SignalStrength.STRONG)
+
+    generator.fundamental_analyzer = RecordingAnalyzer()
+    generator.generate_signal = fake_signal
+
+    signals = generator.generate_signals([CurrencyPair.USD_JPY, CurrencyPair.GBP_USD, CurrencyPair.EUR_USD])
+
+    assert list(signals) == ['USD/JPY', 'EUR/USD']
+
+
+def make_zone(zone_type):
+    return LiquidityZone(
+        zone_type=zone_type,
+        price_level=1.1,
+        price_range=(1.1, 1.1),
+        strength=3,
+        touches=0,
+        time_detected=pd.Timestamp('2024-01-01', tz='UTC'),
+        candle_index=0
+    )
+
+
+def test_best_entry_zone_prefers_matching_type(generator):
+    zones = [
+        make_zone(LiquidityZoneType.EQUAL_HIGHS),
+        make_zone(LiquidityZoneType.FAIR_VALUE_GAP_BULLISH),
+        make_zone(LiquidityZoneType.FAIR_VALUE_GAP_BEARISH),
+    ]
+
+    assert generator._find_best_entry_zone(zones, 'long') is zones[1]
+    assert generator._find_best_entry_zone(zones, 'short') is zones[0]
+    assert generator._find_best_entry_zone(zones[1:2], 'short') is zones[1]
+    assert generator._find_best_entry_zone([], 'long') is None
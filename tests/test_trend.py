@@ -0,0 +1,112 @@
+"""Tests for analysis.trend_detector"""
+
+import dataclasses
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.trend_detector import TrendDetector
+from core.config import config
+from core.enums import CurrencyPair, TimeFrame
+
+
+@pytest.fixture
+def detector():
+    return TrendDetector()
+
+
+def test_emas_match_pandas_ewm(detector):
+    rng = np.random.default_rng(0)
+    close = np.r_[[1.25] * 5, 1.25 + np.cumsum(rng.normal(0, 0.0008, 500))]
+    df = pd.DataFrame({'close': close})
+
+    df = detector._calculate_emas(df)
+
+    np.testing.assert_array_equal(df['ema50'], df['close'].ewm(span=config.EMA_FAST, adjust=False).mean())
+    np.testing.assert_array_equal(df['ema200'], df['close'].ewm(span=config.EMA_SLOW, adjust=False).mean())
+
+
+class SlowFetcher:
+    """Stand-in fetcher whose calls block until both timeframes are in flight"""
+
+    def __init__(self, df):
+        self.df = df
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def fetch_data(self, pair, timeframe):
+        self.barrier.wait()
+        return self.df.copy()
+
+
+def test_multi_timeframe_fetches_concurrently(detector):
+    close = 1.25 + np.cumsum(np.random.default_rng(1).normal(0, 0.0008, 300))
+    df = pd.DataFrame({'open': close, 'high': close + 0.0005, 'low': close - 0.0005, 'close': close})
+    detector.fetcher = SlowFetcher(df)
+
+    trends = detector.analyze_multi_timeframe(CurrencyPair.EUR_USD)
+
+    assert trends['H4'].timeframe == TimeFrame.H4
+    assert trends['H1'].timeframe == TimeFrame.H1
+    assert trends['H4'].direction == trends['H1'].direction
+
+
+class CountingFetcher:
+    """Stand-in fetcher that records how often it is called"""
+
+    def __init__(self, df):
+        self.df = df
+        self.calls = 0
+
+    def fetch_data(self, pair, timeframe):
+        self.calls += 1
+        return self.df.copy()
+
+
+def test_analyze_trend_reuses_bucket(detector):
+    close = 1.25 + np.cumsum(np.random.default_rng(2).normal(0, 0.0008, 300))
+    detector.fetcher = CountingFetcher(pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close}))
+    detector._cache_bucket = lambda: 1
+
+    first = detector.analyze_trend(CurrencyPair.EUR_USD, TimeFrame.H4)
+    assert detector.analyze_trend(CurrencyPair.EUR_USD, TimeFrame.H4) is first
+    assert detector.fetcher.calls == 1
+
+    detector._cache_bucket = lambda: 2
+    assert detector.analyze_trend(CurrencyPair.EUR_USD, TimeFrame.H4) is not first
+    assert detector.fetcher.calls == 2
+
+    # Shared memo results cannot be modified by one caller
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.direction = None
+
+
+class PairFetcher:
+    """Stand-in fetcher serving a fixed frame per pair"""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def fetch_data(self, pair, timeframe):
+        return self.frames[pair].copy()
+
+
+def test_analyze_batch_matches_analyze_trend(detector):
+    rng = np.random.default_rng(3)
+    frames = {}
+    for pair, bars in [(CurrencyPair.EUR_USD, 300), (CurrencyPair.GBP_USD, 300), (CurrencyPair.USD_JPY, 6)]:
+        close = 1.25 + np.cumsum(rng.normal(0, 0.002, bars))
+        frames[pair] = pd.DataFrame({'open': close, 'high': close + rng.random(bars) * 0.001,
+                                     'low': close - rng.random(bars) * 0.001, 'close': close})
+    detector.fetcher = PairFetcher(frames)
+
+    batch = detector.analyze_batch(list(frames), TimeFrame.H4)
+
+    assert list(batch) == ['EUR/USD', 'GBP/USD', 'USD/JPY']
+    for pair in frames:
+        single = detector.analyze_trend(pair, TimeFrame.H4)
+        result = batch[pair.value]
+        assert (result.direction, result.strength, result.ema50) == (single.direction, single.strength, single.ema50)
+        assert (result.higher_highs, result.higher_lows, result.lower_highs, result.lower_lows) == \
+            (single.higher_highs, single.higher_lows, single.lower_highs, single.lower_lows)